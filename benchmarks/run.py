@@ -0,0 +1,249 @@
+"""Benchmark the example workflows and cdk handlers against a local stand-in for NovaAct.
+
+Each scenario runs in its own subprocess at every requested concurrency level, so peak RSS is
+measured per run rather than accumulated across scenarios. The stand-in answers every call with a
+synthetic, schema-conforming response after a simulated latency (see benchmarks/standin.py), which
+makes runs repeatable and isolates the cost of the orchestration code around NovaAct.
+
+Usage:
+python -m benchmarks.run [--scenarios apartments qa form_fill lambda agentcore] [--concurrency 1 2 4 8] \
+    [--latency_scale <factor>] [--size <work items per run>] [--output <results.json>]
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Default number of work items (apartments, test runs, rows or invocations) per scenario run
+DEFAULT_SIZES = {"apartments": 20, "qa": 8, "form_fill": 40, "lambda": 16, "agentcore": 16}
+
+
+def _timed_invocations(invoke, size: int, concurrency: int) -> None:
+    from benchmarks.standin import TIMINGS
+
+    def timed(_):
+        started = time.monotonic()
+        invoke()
+        TIMINGS.add("invocation", time.monotonic() - started)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(size)))
+
+
+def run_apartments(size: int, concurrency: int) -> None:
+    from examples import search_apartments_calculate_commute
+
+    search_apartments_calculate_commute.main(
+        apartment_url="https://apartments.stand-in.invalid",
+        maps_url="https://maps.stand-in.invalid",
+        headless=True,
+        min_apartments_to_find=size,
+        pool_size=concurrency,
+        commute_cache_path="",
+        pipeline=True,
+    )
+
+
+def run_qa(size: int, concurrency: int) -> None:
+    from examples import qa
+
+    _timed_invocations(qa.main, size, concurrency)
+
+
+def run_form_fill(size: int, concurrency: int) -> None:
+    import pandas as pd
+
+    from examples.tool_use.excel import form_fill
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workbook = Path(tmp) / "people.xlsx"
+        pd.DataFrame(
+            {
+                "First Name": [f"First{i}" for i in range(size)],
+                "Last Name": [f"Last{i}" for i in range(size)],
+                "Email": [f"person{i}@example.com" for i in range(size)],
+                "Phone": [f"555-{i:04d}" for i in range(size)],
+                "Address": [f"{i} Main St" for i in range(size)],
+            }
+        ).to_excel(workbook, index=False)
+        form_fill.main(
+            file_name=str(workbook),
+            bulk=True,
+            workers=concurrency,
+            output=str(Path(tmp) / "results.jsonl"),
+        )
+
+
+def run_lambda(size: int, concurrency: int) -> None:
+    from examples.replay import load_handler
+
+    handler = load_handler(str(REPO_ROOT / "cdk/lambda/app.py") + ":handler")
+    _timed_invocations(lambda: handler({}, None), size, concurrency)
+
+
+def run_agentcore(size: int, concurrency: int) -> None:
+    os.environ["BROWSER_POOL_MAX_SESSIONS"] = str(concurrency)
+    from examples.replay import load_handler
+
+    handler = load_handler(str(REPO_ROOT / "cdk/agentcore/handler.py") + ":handler")
+    _timed_invocations(lambda: handler({}), size, concurrency)
+
+
+SCENARIOS = {
+    "apartments": run_apartments,
+    "qa": run_qa,
+    "form_fill": run_form_fill,
+    "lambda": run_lambda,
+    "agentcore": run_agentcore,
+}
+
+
+def percentiles(samples: list[float]) -> dict:
+    if len(samples) == 1:
+        p50 = p95 = p99 = samples[0]
+    else:
+        cuts = statistics.quantiles(samples, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    return {
+        "count": len(samples),
+        "p50_ms": round(p50 * 1000, 2),
+        "p95_ms": round(p95 * 1000, 2),
+        "p99_ms": round(p99 * 1000, 2),
+    }
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_child(scenario: str, size: int, concurrency: int, latency_scale: float, output: str) -> None:
+    """Runs one scenario in this process and writes its measurements to `output`."""
+    from benchmarks import standin
+
+    # The apartments scenario takes all its listings from the first extracted page
+    standin.install(latency_scale, items_per_array=size if scenario == "apartments" else 3)
+    os.environ.setdefault("NOVA_ACT_API_KEY", "stand-in")
+
+    started = time.monotonic()
+    error = None
+    try:
+        SCENARIOS[scenario](size, concurrency)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    wall_seconds = time.monotonic() - started
+
+    result = {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "size": size,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_per_minute": round(size / wall_seconds * 60, 2),
+        "peak_rss_mb": peak_rss_mb(),
+        "calls": {method: percentiles(samples) for method, samples in standin.TIMINGS.by_method().items()},
+        "error": error,
+    }
+    Path(output).write_text(json.dumps(result))
+
+
+def run_scenario(scenario: str, size: int, concurrency: int, latency_scale: float) -> dict:
+    with tempfile.NamedTemporaryFile(suffix=".json") as output:
+        process = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.run",
+                "--child",
+                scenario,
+                "--size",
+                str(size),
+                "--concurrency",
+                str(concurrency),
+                "--latency_scale",
+                str(latency_scale),
+                "--output",
+                output.name,
+            ],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        raw = Path(output.name).read_text()
+    if process.returncode != 0 or not raw:
+        return {
+            "scenario": scenario,
+            "concurrency": concurrency,
+            "size": size,
+            "error": process.stderr.strip().splitlines()[-1] if process.stderr.strip() else "no result",
+        }
+    return json.loads(raw)
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--latency_scale", type=float, default=0.01, help="Multiplier for the simulated NovaAct latency"
+    )
+    parser.add_argument("--size", type=int, help="Work items per run, overriding the per-scenario default")
+    parser.add_argument("--output", default="benchmark-results.json", help="JSON results file")
+    parser.add_argument("--child", choices=list(SCENARIOS), help=argparse.SUPPRESS)
+    options = parser.parse_args()
+
+    if options.child:
+        size = options.size or DEFAULT_SIZES[options.child]
+        run_child(options.child, size, options.concurrency[0], options.latency_scale, options.output)
+        return
+
+    results = []
+    for scenario in options.scenarios:
+        size = options.size or DEFAULT_SIZES[scenario]
+        for concurrency in options.concurrency:
+            result = run_scenario(scenario, size, concurrency, options.latency_scale)
+            results.append(result)
+            if result.get("error"):
+                print(f"{scenario:<11} c={concurrency:<3} error: {result['error']}", file=sys.stderr)
+            else:
+                print(
+                    f"{scenario:<11} c={concurrency:<3} {result['wall_seconds']:>8.2f}s "
+                    f"{result['throughput_per_minute']:>9.1f}/min {result['peak_rss_mb']:>8.1f} MB",
+                    file=sys.stderr,
+                )
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "latency_scale": options.latency_scale,
+        "results": results,
+    }
+    Path(options.output).write_text(json.dumps(report, indent=2))
+    print(f"Results written to {options.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
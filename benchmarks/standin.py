@@ -0,0 +1,154 @@
+"""Local stand-in for NovaAct used by the benchmarks.
+
+Instead of replaying a recording, the stand-in answers any prompt with a synthetic response that
+matches the requested schema, after a configurable simulated latency. Every browser launch and
+act/act_get call is timed so the benchmark can report per-call percentiles.
+"""
+
+import itertools
+import sys
+import threading
+import time
+import types
+from typing import Any
+
+import nova_act
+
+from examples.replay import ReplayNovaAct, ReplayResult, _offline_workflow
+
+# Simulated seconds per call before `latency_scale` is applied, roughly what a live run sees
+DEFAULT_LATENCY = {"start": 2.0, "act": 8.0, "act_get": 5.0}
+
+
+class CallTimings:
+    """Thread-safe collection of (method, seconds) for every stand-in call."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls: list[tuple[str, float]] = []
+
+    def add(self, method: str, seconds: float) -> None:
+        with self._lock:
+            self.calls.append((method, seconds))
+
+    def by_method(self) -> dict[str, list[float]]:
+        with self._lock:
+            grouped: dict[str, list[float]] = {}
+            for method, seconds in self.calls:
+                grouped.setdefault(method, []).append(seconds)
+            return grouped
+
+
+TIMINGS = CallTimings()
+_unique = itertools.count(1)
+
+
+def synthesize(schema: Any, defs: dict | None = None, items_per_array: int = 3) -> Any:
+    """Builds a value matching a JSON schema. Strings are unique so deduplication sees new data."""
+    if not isinstance(schema, dict):
+        return None
+    defs = schema.get("$defs", defs or {})
+    if "$ref" in schema:
+        return synthesize(defs[schema["$ref"].split("/")[-1]], defs, items_per_array)
+    for combinator in ("anyOf", "oneOf", "allOf"):
+        if combinator in schema:
+            return synthesize(schema[combinator][0], defs, items_per_array)
+    schema_type = schema.get("type")
+    if schema_type == "object":
+        return {
+            name: synthesize(prop, defs, items_per_array)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if schema_type == "array":
+        return [synthesize(schema.get("items", {}), defs, items_per_array) for _ in range(items_per_array)]
+    if schema_type == "boolean":
+        return True
+    if schema_type == "integer":
+        return next(_unique) % 60
+    if schema_type == "number":
+        return float(next(_unique) % 100) / 10
+    return f"stand-in {next(_unique)}"
+
+
+class StandInNovaAct(ReplayNovaAct):
+    """Offline NovaAct that synthesizes schema-conforming responses after a simulated latency."""
+
+    latency: dict[str, float] = DEFAULT_LATENCY
+    latency_scale: float = 0.01
+    items_per_array: int = 3
+
+    def _simulate(self, method: str) -> None:
+        started = time.monotonic()
+        time.sleep(self.latency[method] * self.latency_scale)
+        TIMINGS.add(method, time.monotonic() - started)
+
+    def start(self) -> None:
+        self._simulate("start")
+        self.started = True
+
+    def go_to_url(self, url: str) -> None:
+        self.page.goto(url)
+
+    def act(self, prompt: str, **kwargs) -> ReplayResult:
+        self._simulate("act")
+        return ReplayResult(response="Done")
+
+    def act_get(self, prompt: str, schema: Any = None, **kwargs) -> ReplayResult:
+        self._simulate("act_get")
+        parsed = synthesize(schema, items_per_array=self.items_per_array) if schema else "stand-in"
+        return ReplayResult(str(parsed), parsed, True, True)
+
+
+class StandInBrowserClient:
+    """Stand-in for AgentCore's BrowserClient that provisions nothing."""
+
+    def __init__(self, region: str):
+        self.region = region
+
+    def start(self, **kwargs) -> str:
+        TIMINGS.add("browser_session_start", 0.0)
+        return "stand-in-session"
+
+    def stop(self) -> None:
+        pass
+
+    def generate_ws_headers(self) -> tuple[str, dict]:
+        return "wss://stand-in.invalid", {"Authorization": "stand-in"}
+
+
+def _install_agentcore_standin() -> None:
+    try:
+        from bedrock_agentcore.tools import browser_client
+    except ImportError:
+        # Provide just enough of the AgentCore SDK for cdk/agentcore/handler.py to import
+        class App:
+            def route(self, path):
+                return lambda func: func
+
+            def entrypoint(self, func):
+                return func
+
+            def run(self):
+                pass
+
+        runtime = types.ModuleType("bedrock_agentcore.runtime")
+        runtime.BedrockAgentCoreApp = App
+        browser_client = types.ModuleType("bedrock_agentcore.tools.browser_client")
+        sys.modules.update(
+            {
+                "bedrock_agentcore": types.ModuleType("bedrock_agentcore"),
+                "bedrock_agentcore.runtime": runtime,
+                "bedrock_agentcore.tools": types.ModuleType("bedrock_agentcore.tools"),
+                "bedrock_agentcore.tools.browser_client": browser_client,
+            }
+        )
+    browser_client.BrowserClient = StandInBrowserClient
+
+
+def install(latency_scale: float, items_per_array: int = 3) -> None:
+    """Replaces NovaAct, @workflow and AgentCore Browser with local stand-ins. Call before importing targets."""
+    StandInNovaAct.latency_scale = latency_scale
+    StandInNovaAct.items_per_array = items_per_array
+    nova_act.NovaAct = StandInNovaAct
+    nova_act.workflow = _offline_workflow
+    _install_agentcore_standin()
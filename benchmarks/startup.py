@@ -0,0 +1,108 @@
+"""Check that the example CLIs start quickly: import time and memory per module, against a budget.
+
+Each example module is imported in a fresh interpreter, as a short-lived CLI or cron run would do,
+without running its workflow. NOVA_API_KEY is removed from the environment, so modules that need
+it only when they run still import cleanly. The median import time and peak RSS over `--runs`
+processes are compared with the budget, and the command exits non-zero if any module is over.
+
+Usage:
+python -m benchmarks.startup [--modules examples.qa ...] [--runs 3] [--max_import_ms 1500] \
+    [--max_rss_mb 300] [--output startup-results.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Runs in the child: time the import of one module, then report peak RSS
+PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+import importlib
+importlib.import_module(sys.argv[1])
+import_ms = (time.perf_counter() - started) * 1000
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+peak_mb = peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+heavy = sorted(name for name in ("pandas", "strands", "fire", "pyarrow") if name in sys.modules)
+print(json.dumps({"import_ms": import_ms, "peak_rss_mb": peak_mb, "heavy_modules": heavy}))
+"""
+
+
+def example_modules() -> list[str]:
+    """Every example that can be run with `python -m`."""
+    modules = []
+    for path in sorted((REPO_ROOT / "examples").rglob("*.py")):
+        if "__main__" in path.read_text():
+            modules.append(".".join(path.relative_to(REPO_ROOT).with_suffix("").parts))
+    return modules
+
+
+def measure(module: str, runs: int) -> dict:
+    env = {key: value for key, value in os.environ.items() if key != "NOVA_API_KEY"}
+    samples = []
+    for _ in range(runs):
+        process = subprocess.run(
+            [sys.executable, "-c", PROBE, module], cwd=REPO_ROOT, env=env, capture_output=True, text=True
+        )
+        if process.returncode != 0:
+            error = process.stderr.strip().splitlines()[-1:] or ["import failed"]
+            return {"module": module, "error": error[0]}
+        samples.append(json.loads(process.stdout.strip().splitlines()[-1]))
+    return {
+        "module": module,
+        "import_ms": round(statistics.median(sample["import_ms"] for sample in samples), 1),
+        "peak_rss_mb": round(statistics.median(sample["peak_rss_mb"] for sample in samples), 1),
+        "heavy_modules": samples[-1]["heavy_modules"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--modules", nargs="+", help="Modules to check (default: every runnable example)")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per module")
+    parser.add_argument("--max_import_ms", type=float, default=1500, help="Import time budget per module")
+    parser.add_argument("--max_rss_mb", type=float, default=300, help="Peak RSS budget per module after import")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    options = parser.parse_args()
+
+    results = []
+    over_budget = []
+    for module in options.modules or example_modules():
+        result = measure(module, options.runs)
+        if "error" in result:
+            over_budget.append(module)
+            print(f"{module:<55} error: {result['error']}", file=sys.stderr)
+        else:
+            result["within_budget"] = (
+                result["import_ms"] <= options.max_import_ms and result["peak_rss_mb"] <= options.max_rss_mb
+            )
+            if not result["within_budget"]:
+                over_budget.append(module)
+            print(
+                f"{module:<55} {result['import_ms']:>8.1f} ms {result['peak_rss_mb']:>7.1f} MB"
+                f"{'' if result['within_budget'] else '  OVER BUDGET'}"
+                f"{'  loads ' + ', '.join(result['heavy_modules']) if result['heavy_modules'] else ''}",
+                file=sys.stderr,
+            )
+        results.append(result)
+
+    if options.output:
+        report = {
+            "budget": {"max_import_ms": options.max_import_ms, "max_rss_mb": options.max_rss_mb},
+            "results": results,
+        }
+        Path(options.output).write_text(json.dumps(report, indent=2))
+
+    if over_budget:
+        print(f"{len(over_budget)} module(s) over budget or failing to import: {', '.join(over_budget)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,24 +6,257 @@ AgentCore Handler for Nova Act Workflows
 This handler uses the @app.entrypoint decorator pattern required for AgentCore runtime.
 """
 
+import atexit
+import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import random
 import sys
 import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
 import boto3
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
-from bedrock_agentcore.tools.browser_client import browser_session
+from bedrock_agentcore.tools.browser_client import BrowserClient
 from nova_act import NovaAct
 
-# Configure logging for CloudWatch
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging for CloudWatch. Records are queued and written to stdout as JSON lines by a
+# background listener thread, so slow stdout writes never block request handling.
+LOG_LEVEL = os.environ.get("NOVA_ACT_LOG_LEVEL", "INFO").upper()
+# Long messages and the request payload are cut to this many characters
+LOG_MAX_CHARS = int(os.environ.get("NOVA_ACT_LOG_MAX_CHARS", "4000"))
+# Set below 1 to keep only a sample of DEBUG records
+LOG_DEBUG_SAMPLE_RATE = float(os.environ.get("NOVA_ACT_LOG_DEBUG_SAMPLE_RATE", "1.0"))
+# Fields passed via `extra=` that are included in the JSON output
+LOG_EXTRA_FIELDS = ("payload",)
+
+
+def _truncate(value):
+    text = value if isinstance(value, str) else str(value)
+    if len(text) > LOG_MAX_CHARS:
+        return f"{text[:LOG_MAX_CHARS]}... [{len(text) - LOG_MAX_CHARS} more chars]"
+    return text
+
+
+class JsonLogFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": _truncate(record.getMessage()),
+        }
+        for key in LOG_EXTRA_FIELDS:
+            if getattr(record, key, None) is not None:
+                entry[key] = _truncate(getattr(record, key))
+        return json.dumps(entry)
+
+
+def configure_logging():
+    log_queue = queue.Queue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonLogFormatter())
+    queue_handler = QueueHandler(log_queue)
+    if LOG_DEBUG_SAMPLE_RATE < 1:
+        queue_handler.addFilter(
+            lambda record: record.levelno > logging.DEBUG or random.random() < LOG_DEBUG_SAMPLE_RATE
+        )
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(LOG_LEVEL)
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    # Stopping the listener writes out anything still queued
+    atexit.register(listener.stop)
+
+
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Resolve the region once at startup, fallback to us-east-1
+REGION = boto3.Session().region_name or 'us-east-1'
+
+# Browser session pool configuration
+MAX_BROWSER_SESSIONS = int(os.environ.get('BROWSER_POOL_MAX_SESSIONS', '4'))
+# Pre-warming is opt-in, since every idle session is billed even when there is no traffic
+MIN_IDLE_BROWSER_SESSIONS = int(os.environ.get('BROWSER_POOL_MIN_IDLE_SESSIONS', '0'))
+BROWSER_SESSION_TIMEOUT_SECONDS = int(os.environ.get('BROWSER_SESSION_TIMEOUT_SECONDS', '3600'))
+BROWSER_IDLE_TIMEOUT_SECONDS = int(os.environ.get('BROWSER_IDLE_TIMEOUT_SECONDS', '600'))
+# Sessions this close to expiry are replaced rather than handed out
+BROWSER_REFRESH_MARGIN_SECONDS = int(os.environ.get('BROWSER_REFRESH_MARGIN_SECONDS', '300'))
+# SigV4-signed WebSocket headers are only valid for five minutes
+WS_HEADERS_TTL_SECONDS = 240
+
+
+class PooledBrowserSession:
+    """An AgentCore Browser session plus its cached CDP connection details."""
+
+    def __init__(self):
+        self.client = BrowserClient(REGION)
+        self.client.start(session_timeout_seconds=BROWSER_SESSION_TIMEOUT_SECONDS)
+        self.started_at = time.monotonic()
+        self.last_used_at = self.started_at
+        # Cleared when the browser state could not be reset after a request
+        self.reusable = True
+        self._ws_url = None
+        self._headers = None
+        self._headers_at = 0.0
+
+    def ws_connection(self):
+        if self._headers is None or time.monotonic() - self._headers_at > WS_HEADERS_TTL_SECONDS:
+            self._ws_url, self._headers = self.client.generate_ws_headers()
+            self._headers_at = time.monotonic()
+        return self._ws_url, self._headers
+
+    def expires_soon(self):
+        age = time.monotonic() - self.started_at
+        return age > BROWSER_SESSION_TIMEOUT_SECONDS - BROWSER_REFRESH_MARGIN_SECONDS
+
+    def idle_too_long(self):
+        return time.monotonic() - self.last_used_at > BROWSER_IDLE_TIMEOUT_SECONDS
+
+    def stop(self):
+        try:
+            self.client.stop()
+            logger.info("✅ Browser session terminated")
+        except Exception as e:
+            logger.warning(f"Failed to stop browser session: {e}")
+
+
+class BrowserSessionPool:
+    """
+    Process-level pool of AgentCore Browser sessions with lease/return semantics.
+
+    Idle sessions are stopped after BROWSER_IDLE_TIMEOUT_SECONDS, sessions nearing their timeout are
+    replaced in the background, and MIN_IDLE_BROWSER_SESSIONS are kept provisioned ahead of requests.
+    Callers must reset the browser state before returning a session, or mark it not reusable.
+    """
+
+    def __init__(self):
+        self._idle = []
+        self._total = 0
+        self._condition = threading.Condition()
+        threading.Thread(target=self._maintain, daemon=True).start()
+
+    @contextmanager
+    def lease(self):
+        session = self._acquire()
+        try:
+            yield session
+        except Exception:
+            # The session may be in an unknown state, so don't hand it to another request
+            self._discard(session)
+            raise
+        else:
+            if not session.reusable:
+                self._discard(session)
+                return
+            session.last_used_at = time.monotonic()
+            with self._condition:
+                self._idle.append(session)
+                self._condition.notify()
+
+    def _acquire(self):
+        with self._condition:
+            while True:
+                while self._idle:
+                    session = self._idle.pop()
+                    if not session.expires_soon():
+                        logger.info("Reusing pooled browser session")
+                        return session
+                    self._total -= 1
+                    threading.Thread(target=session.stop, daemon=True).start()
+                if self._total < MAX_BROWSER_SESSIONS:
+                    self._total += 1
+                    break
+                self._condition.wait()
+        logger.info("Creating a new browser session")
+        try:
+            return PooledBrowserSession()
+        except Exception:
+            with self._condition:
+                self._total -= 1
+                self._condition.notify()
+            raise
+
+    def _discard(self, session):
+        session.stop()
+        with self._condition:
+            self._total -= 1
+            self._condition.notify()
+
+    def _maintain(self):
+        while True:
+            with self._condition:
+                stale = [s for s in self._idle if s.expires_soon() or s.idle_too_long()]
+                self._idle = [s for s in self._idle if s not in stale]
+                self._total -= len(stale)
+                # Top up to the minimum idle sessions so requests don't wait for provisioning
+                missing = max(
+                    min(
+                        MIN_IDLE_BROWSER_SESSIONS - len(self._idle),
+                        MAX_BROWSER_SESSIONS - self._total,
+                    ),
+                    0,
+                )
+                self._total += missing
+            for session in stale:
+                session.stop()
+            for _ in range(missing):
+                try:
+                    session = PooledBrowserSession()
+                except Exception as e:
+                    logger.warning(f"Failed to provision browser session: {e}")
+                    with self._condition:
+                        self._total -= 1
+                    continue
+                with self._condition:
+                    self._idle.append(session)
+                    self._condition.notify()
+            time.sleep(30)
+
+
+browser_pool = BrowserSessionPool()
+
+
+def _origin(url):
+    parsed = urlparse(url)
+    if parsed.scheme in ("http", "https") and parsed.netloc:
+        return f"{parsed.scheme}://{parsed.netloc}"
+    return None
+
+
+def _track_origins(context, origins):
+    """Adds the origin of every page navigation in `context` to `origins`."""
+
+    def on_navigated(frame):
+        origin = _origin(frame.url)
+        if origin:
+            origins.add(origin)
+
+    def watch(page):
+        page.on("framenavigated", on_navigated)
+
+    for page in context.pages:
+        watch(page)
+    context.on("page", watch)
+
+
+def _reset_browser_state(page, origins):
+    """Clear cookies and the storage of every visited origin before the session is reused."""
+    cdp = page.context.new_cdp_session(page)
+    try:
+        cdp.send("Network.clearBrowserCookies")
+        for origin in origins:
+            cdp.send("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    finally:
+        cdp.detach()
+
 # Initialize the app
 app = BedrockAgentCoreApp()
 
@@ -43,7 +276,7 @@ def handler(payload):
     Returns:
         dict: Response with status and result
     """
-    logger.info(f"Handler started - Payload received: {payload}")
+    logger.info("Handler started", extra={"payload": payload})
     
     try:
         # Get API key from environment
@@ -57,21 +290,16 @@ def handler(payload):
         default_starting_page = "https://nova.amazon.com/act/gym/next-dot/search"
         starting_page = payload.get("starting_page", default_starting_page) if isinstance(payload, dict) else default_starting_page
         
-        logger.info("Starting Nova Act with AgentCore browser session...")
+        logger.info("Starting Nova Act with a pooled AgentCore browser session...")
         logger.info(f"Prompt: {prompt}")
         logger.info(f"Starting page: {starting_page}")
         
-        # Create browser session
-        logger.info("Creating the browser session")
-        # Get current AWS region from boto3 session, fallback to us-east-1
-        session = boto3.Session()
-        region = session.region_name or 'us-east-1'
-        with browser_session(region) as client:
-            logger.info("Created the browser session. Getting ws url and headers")
-            ws_url, headers = client.generate_ws_headers()
+        with browser_pool.lease() as browser:
+            ws_url, headers = browser.ws_connection()
             logger.info(f"ws_url is {ws_url}")
-            logger.info(f"headers are {headers}")
-            
+            # The headers carry SigV4 credentials, so only their names are logged
+            logger.info(f"headers: {sorted(headers)}")
+
             # Execute Nova Act workflow with API key
             with NovaAct(
                 nova_act_api_key=api_key,
@@ -82,22 +310,29 @@ def handler(payload):
                 cdp_endpoint_url=ws_url,
                 cdp_headers=headers,
             ) as nova_act:
-                logger.info("Invoking Nova Act")
-                result = nova_act.act(prompt)
-                logger.info(f"Nova Act result: {result}")
-                
+                # Pooled sessions are shared between callers, so record what this request visits
+                visited_origins = {origin for origin in [_origin(starting_page)] if origin}
+                _track_origins(nova_act.page.context, visited_origins)
+                try:
+                    logger.info("Invoking Nova Act")
+                    result = nova_act.act(prompt)
+                    logger.info(f"Nova Act result: {result}")
+                finally:
+                    try:
+                        _reset_browser_state(nova_act.page, visited_origins)
+                    except Exception as e:
+                        logger.warning(f"Failed to reset browser state, not reusing the session: {e}")
+                        browser.reusable = False
+
                 return {
                     "status": "success",
                     "response": str(result),
                     "prompt": prompt,
                     "starting_page": starting_page
                 }
-                
+
     except Exception as e:
-        logger.error(f"Error occurred: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception(f"Error occurred: {str(e)}")
         return {
             "status": "error", 
             "response": str(e),
@@ -105,10 +340,7 @@ def handler(payload):
             "starting_page": payload.get("starting_page", "") if isinstance(payload, dict) else ""
         }
     finally:
-        logger.info("Shutting down...")
-        if "client" in locals():
-            client.stop()
-            logger.info("✅ Browser session terminated")
+        logger.info("Request finished")
 
 if __name__ == "__main__":
     app.run()
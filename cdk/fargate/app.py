@@ -1,16 +1,332 @@
+import atexit
+import contextlib
+import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import random
+import signal
+import sqlite3
 import sys
 import os
+import threading
+import time
+from urllib.parse import urlparse
 from nova_act import NovaAct
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
+# Configure logging for CloudWatch. Records are queued and written to stdout as JSON lines by a
+# background listener thread, so slow stdout writes never block a job.
+LOG_LEVEL = os.environ.get("NOVA_ACT_LOG_LEVEL", "INFO").upper()
+# Long messages are cut to this many characters
+LOG_MAX_CHARS = int(os.environ.get("NOVA_ACT_LOG_MAX_CHARS", "4000"))
+# Set below 1 to keep only a sample of DEBUG records
+LOG_DEBUG_SAMPLE_RATE = float(os.environ.get("NOVA_ACT_LOG_DEBUG_SAMPLE_RATE", "1.0"))
+
+
+class JsonLogFormatter(logging.Formatter):
+    def format(self, record):
+        message = record.getMessage()
+        if len(message) > LOG_MAX_CHARS:
+            message = f"{message[:LOG_MAX_CHARS]}... [{len(message) - LOG_MAX_CHARS} more chars]"
+        return json.dumps(
+            {
+                "timestamp": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": message,
+            }
+        )
+
+
+def configure_logging():
+    log_queue = queue.Queue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonLogFormatter())
+    queue_handler = QueueHandler(log_queue)
+    if LOG_DEBUG_SAMPLE_RATE < 1:
+        queue_handler.addFilter(
+            lambda record: record.levelno > logging.DEBUG or random.random() < LOG_DEBUG_SAMPLE_RATE
+        )
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(LOG_LEVEL)
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    # Stopping the listener writes out anything still queued
+    atexit.register(listener.stop)
+
+
+configure_logging()
 logger = logging.getLogger(__name__)
 
+DEFAULT_PROMPT = "Find flights from Boston to Wolf on Feb 22nd"
+DEFAULT_STARTING_PAGE = "https://nova.amazon.com/act/gym/next-dot/search"
+
+
+class SqsJobQueue:
+    """Jobs are SQS messages whose body is a JSON object with `prompt` and `starting_page`.
+
+    receive() returns the raw message body. The worker parses it, so a malformed message is
+    completed as an error instead of being redelivered forever.
+
+    A received message is hidden from other workers for `visibility_timeout` seconds. While a job
+    runs, keep_visible() extends that every half timeout, so a long job is never redelivered to
+    another worker mid-run.
+    """
+
+    def __init__(self, queue_url, results_queue_url=None, wait_seconds=20, visibility_timeout=300):
+        import boto3
+
+        self.queue_url = queue_url
+        self.results_queue_url = results_queue_url
+        self.wait_seconds = wait_seconds
+        self.visibility_timeout = visibility_timeout
+        self.sqs = boto3.client("sqs")
+
+    def enqueue(self, job):
+        self.sqs.send_message(QueueUrl=self.queue_url, MessageBody=json.dumps(job))
+
+    def receive(self):
+        response = self.sqs.receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=1,
+            WaitTimeSeconds=self.wait_seconds,
+            VisibilityTimeout=self.visibility_timeout,
+        )
+        for message in response.get("Messages", []):
+            return message["ReceiptHandle"], message["Body"]
+        return None
+
+    @contextlib.contextmanager
+    def keep_visible(self, receipt):
+        """Keeps the message hidden from other workers until the block exits."""
+        done = threading.Event()
+
+        def heartbeat():
+            while not done.wait(self.visibility_timeout / 2):
+                try:
+                    self.sqs.change_message_visibility(
+                        QueueUrl=self.queue_url,
+                        ReceiptHandle=receipt,
+                        VisibilityTimeout=self.visibility_timeout,
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to extend message visibility: {e}")
+
+        thread = threading.Thread(target=heartbeat, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            done.set()
+            thread.join()
+
+    def complete(self, receipt, result):
+        if self.results_queue_url:
+            self.sqs.send_message(QueueUrl=self.results_queue_url, MessageBody=json.dumps(result))
+        self.sqs.delete_message(QueueUrl=self.queue_url, ReceiptHandle=receipt)
+
+
+class SqliteJobQueue:
+    """Local SQLite-backed queue for testing the worker without AWS."""
+
+    def __init__(self, path, poll_seconds=2):
+        self.poll_seconds = poll_seconds
+        self.db = sqlite3.connect(path, isolation_level=None)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, payload TEXT NOT NULL, "
+            "status TEXT NOT NULL DEFAULT 'pending', result TEXT)"
+        )
+
+    def enqueue(self, job):
+        self.db.execute("INSERT INTO jobs (payload) VALUES (?)", (json.dumps(job),))
+
+    def receive(self):
+        # Claim the oldest pending job inside a write transaction so concurrent workers never share one
+        self.db.execute("BEGIN IMMEDIATE")
+        row = self.db.execute(
+            "SELECT id, payload FROM jobs WHERE status = 'pending' ORDER BY id LIMIT 1"
+        ).fetchone()
+        if row is not None:
+            self.db.execute("UPDATE jobs SET status = 'running' WHERE id = ?", (row[0],))
+        self.db.execute("COMMIT")
+        if row is None:
+            time.sleep(self.poll_seconds)
+            return None
+        return row[0], row[1]
+
+    def keep_visible(self, receipt):
+        # A claimed job stays 'running' until it is completed, so there is nothing to extend
+        return contextlib.nullcontext()
+
+    def complete(self, receipt, result):
+        self.db.execute(
+            "UPDATE jobs SET status = ?, result = ? WHERE id = ?",
+            (result["status"], json.dumps(result), receipt),
+        )
+
+
+def get_job_queue():
+    """Returns the configured job queue, or None to run a single prompt and exit."""
+    queue_url = os.environ.get("NOVA_ACT_QUEUE_URL")
+    if queue_url:
+        return SqsJobQueue(
+            queue_url,
+            os.environ.get("NOVA_ACT_RESULTS_QUEUE_URL"),
+            visibility_timeout=int(os.environ.get("NOVA_ACT_QUEUE_VISIBILITY_TIMEOUT_SECONDS", "300")),
+        )
+    queue_path = os.environ.get("NOVA_ACT_QUEUE_PATH")
+    if queue_path:
+        return SqliteJobQueue(queue_path)
+    return None
+
+
+def _is_browser_alive(nova_act):
+    try:
+        return not nova_act.page.is_closed() and nova_act.page.evaluate("1") == 1
+    except Exception:
+        return False
+
+
+def _origin(url):
+    parsed = urlparse(url)
+    if parsed.scheme in ("http", "https") and parsed.netloc:
+        return f"{parsed.scheme}://{parsed.netloc}"
+    return None
+
+
+def _track_origins(nova_act, origins):
+    """Add the origin of every navigation in the browser to `origins`."""
+
+    def on_navigated(frame):
+        origin = _origin(frame.url)
+        if origin:
+            origins.add(origin)
+
+    def watch(page):
+        page.on("framenavigated", on_navigated)
+
+    context = nova_act.page.context
+    for page in context.pages:
+        watch(page)
+    context.on("page", watch)
+    # The starting page loaded before the listener was attached
+    on_navigated(nova_act.page)
+
+
+def _reset_browser_state(nova_act, origins):
+    """Clear cookies and the storage of every origin visited since the last reset."""
+    page = nova_act.page
+    cdp = page.context.new_cdp_session(page)
+    try:
+        for origin in origins:
+            cdp.send("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    finally:
+        cdp.detach()
+    page.context.clear_cookies()
+    origins.clear()
+
+
+def _parse_job(body):
+    job = json.loads(body)
+    if not isinstance(job, dict):
+        raise ValueError(f"Job must be a JSON object, got {type(job).__name__}")
+    return job
+
+
+def _stop_browser(nova_act):
+    try:
+        nova_act.stop()
+    except Exception as e:
+        logger.warning(f"Failed to stop the browser: {e}")
+
+
+def run_worker(job_queue):
+    """Process jobs from `job_queue` on a warm browser until SIGTERM, then drain and exit."""
+    api_key = os.environ.get("NOVA_ACT_API_KEY")
+    if not api_key:
+        raise ValueError("NOVA_ACT_API_KEY environment variable is required")
+
+    # Finish the job in progress on SIGTERM, but don't take any new ones
+    stopping = threading.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *_: stopping.set())
+
+    nova_act = None
+    # Origins the current browser has visited since its last reset
+    visited_origins = set()
+    completed = 0
+    started = time.monotonic()
+    logger.info(f"Worker started, polling {type(job_queue).__name__}")
+    try:
+        while not stopping.is_set():
+            message = job_queue.receive()
+            if message is None:
+                continue
+            receipt, body = message
+            result = {}
+
+            # Keep the message from being redelivered to another worker while the job runs
+            with job_queue.keep_visible(receipt):
+                job_started = time.monotonic()
+                try:
+                    # A message that isn't a valid job is completed as an error, not redelivered
+                    job = _parse_job(body)
+                    prompt = job.get("prompt", DEFAULT_PROMPT)
+                    starting_page = job.get("starting_page", DEFAULT_STARTING_PAGE)
+                    result |= {"prompt": prompt, "starting_page": starting_page, "job_id": job.get("job_id")}
+
+                    if nova_act is not None:
+                        try:
+                            if not _is_browser_alive(nova_act):
+                                raise RuntimeError("Browser is not responding")
+                            _reset_browser_state(nova_act, visited_origins)
+                            nova_act.go_to_url(starting_page)
+                        except Exception as e:
+                            # A browser that can't be reset would fail every later job, so replace it
+                            logger.warning(f"Failed to reset the browser, relaunching: {e}")
+                            # Clear it first, so a failing stop() can't leave the dead browser in place
+                            dead_browser, nova_act = nova_act, None
+                            _stop_browser(dead_browser)
+                    if nova_act is None:
+                        browser = NovaAct(
+                            starting_page=starting_page,
+                            nova_act_api_key=api_key,
+                            headless=True,
+                            record_video=False,
+                            clone_user_data_dir=False,
+                        )
+                        try:
+                            browser.start()
+                        except Exception:
+                            _stop_browser(browser)
+                            raise
+                        # Only keep a browser that started
+                        nova_act = browser
+                        visited_origins = set()
+                        _track_origins(nova_act, visited_origins)
+
+                    logger.info(f"Invoking Nova Act: {prompt}")
+                    result |= {"status": "success", "response": str(nova_act.act(prompt))}
+                except Exception as e:
+                    logger.error(f"Job failed: {str(e)}")
+                    result |= {"status": "error", "response": str(e)}
+                result["duration_ms"] = int((time.monotonic() - job_started) * 1000)
+            job_queue.complete(receipt, result)
+
+            completed += 1
+            elapsed_minutes = (time.monotonic() - started) / 60
+            logger.info(
+                f"Completed {completed} jobs ({completed / elapsed_minutes:.1f} jobs/minute)"
+            )
+    finally:
+        if nova_act is not None:
+            _stop_browser(nova_act)
+        logger.info(f"Worker drained after {completed} jobs")
+
 
 def main():
     logger.info("Starting Nova Act Fargate workflow...")
@@ -21,13 +337,10 @@ def main():
         if not api_key:
             raise ValueError("NOVA_ACT_API_KEY environment variable is required")
 
-        # Set default values
-        default_prompt = "Find flights from Boston to Wolf on Feb 22nd"
-        default_starting_page = "https://nova.amazon.com/act/gym/next-dot/search"
 
         # Use environment variables or defaults
-        prompt = os.environ.get("NOVA_ACT_PROMPT", default_prompt)
-        starting_page = os.environ.get("NOVA_ACT_STARTING_PAGE", default_starting_page)
+        prompt = os.environ.get("NOVA_ACT_PROMPT", DEFAULT_PROMPT)
+        starting_page = os.environ.get("NOVA_ACT_STARTING_PAGE", DEFAULT_STARTING_PAGE)
 
         logger.info(f"Prompt: {prompt}")
         logger.info(f"Starting page: {starting_page}")
@@ -46,13 +359,21 @@ def main():
         logger.info("Fargate task completed successfully")
 
     except Exception as e:
-        logger.error(f"Error occurred: {str(e)}")
-        import traceback
-
-        traceback.print_exc()
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception(f"Error occurred: {str(e)}")
         raise
 
 
 if __name__ == "__main__":
-    main()
+    job_queue = get_job_queue()
+    if len(sys.argv) > 1 and sys.argv[1] == "enqueue":
+        # Add a job to the configured queue: python app.py enqueue "<prompt>" [starting_page]
+        if job_queue is None:
+            raise ValueError("Set NOVA_ACT_QUEUE_URL or NOVA_ACT_QUEUE_PATH to enqueue jobs")
+        job_queue.enqueue({
+            "prompt": sys.argv[2],
+            "starting_page": sys.argv[3] if len(sys.argv) > 3 else DEFAULT_STARTING_PAGE,
+        })
+    elif job_queue is not None:
+        run_worker(job_queue)
+    else:
+        main()
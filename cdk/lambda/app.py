@@ -1,19 +1,318 @@
+import atexit
+import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import random
 import sys
 import os
-from nova_act import NovaAct
-
-# Configure logging for CloudWatch
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
-)
+import time
+from urllib.parse import urlparse
+
+# Imported first so that, when profiling is enabled, every import after it is timed
+from cold_start_profiler import profiler
+
+# Configure logging for CloudWatch. Records are queued and written to stdout as JSON lines by a
+# background listener thread, so slow stdout writes never block request handling.
+LOG_LEVEL = os.environ.get("NOVA_ACT_LOG_LEVEL", "INFO").upper()
+# Long messages and the event payload are cut to this many characters
+LOG_MAX_CHARS = int(os.environ.get("NOVA_ACT_LOG_MAX_CHARS", "4000"))
+# Set below 1 to keep only a sample of DEBUG records
+LOG_DEBUG_SAMPLE_RATE = float(os.environ.get("NOVA_ACT_LOG_DEBUG_SAMPLE_RATE", "1.0"))
+# Fields passed via `extra=` that are included in the JSON output
+LOG_EXTRA_FIELDS = ("event", "request_id")
+
+
+def _truncate(value):
+    text = value if isinstance(value, str) else str(value)
+    if len(text) > LOG_MAX_CHARS:
+        return f"{text[:LOG_MAX_CHARS]}... [{len(text) - LOG_MAX_CHARS} more chars]"
+    return text
+
+
+class JsonLogFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": _truncate(record.getMessage()),
+        }
+        for key in LOG_EXTRA_FIELDS:
+            if getattr(record, key, None) is not None:
+                entry[key] = _truncate(getattr(record, key))
+        return json.dumps(entry)
+
+
+def configure_logging():
+    log_queue = queue.Queue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonLogFormatter())
+    queue_handler = QueueHandler(log_queue)
+    if LOG_DEBUG_SAMPLE_RATE < 1:
+        queue_handler.addFilter(
+            lambda record: record.levelno > logging.DEBUG or random.random() < LOG_DEBUG_SAMPLE_RATE
+        )
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(LOG_LEVEL)
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    # Stopping the listener writes out anything still queued
+    atexit.register(listener.stop)
+    return log_queue
+
+
+_log_queue = configure_logging()
 logger = logging.getLogger(__name__)
 
+DEFAULT_PROMPT = "Find flights from Boston to Wolf on Feb 22nd"
+DEFAULT_STARTING_PAGE = "https://nova.amazon.com/act/gym/next-dot/search"
+
+# Time kept back from the Lambda deadline so a batch can return its results
+DEADLINE_RESERVE_MS = int(os.environ.get("NOVA_ACT_DEADLINE_RESERVE_MS", "30000"))
+
+# Opt-in: keep the browser alive between invocations on a warm container
+WARM_BROWSER = os.environ.get("NOVA_ACT_WARM_BROWSER", "false").lower() == "true"
+
+# What to initialize during the Lambda init phase rather than on the first invocation:
+# "none" (lazy), "imports" (import nova_act) or "browser" (also launch the warm browser)
+EAGER_INIT = os.environ.get("NOVA_ACT_EAGER_INIT", "none").lower()
+if EAGER_INIT == "browser":
+    # A browser launched during init is only useful if invocations reuse it
+    WARM_BROWSER = True
+
+# Imported on first use by load_nova_act(), so cold start only pays for it when needed
+NovaAct = None
+
+# The browser kept alive at module scope when WARM_BROWSER is enabled
+_warm_nova = None
+_invocations = 0
+# Origins each browser has navigated to since its last reset, keyed by id() of the NovaAct
+_visited_origins = {}
+
+
+def load_nova_act():
+    """Import nova_act (and with it Playwright) on first use."""
+    global NovaAct
+    if NovaAct is None:
+        with profiler.phase("import_nova_act"):
+            from nova_act import NovaAct as nova_act_class
+        profiler.time_method(nova_act_class, "start", "nova_act_start")
+        NovaAct = nova_act_class
+    return NovaAct
+
+
+def _is_browser_alive(nova):
+    try:
+        return not nova.page.is_closed() and nova.page.evaluate("1") == 1
+    except Exception:
+        return False
+
+
+def _origin(url):
+    parsed = urlparse(url)
+    if parsed.scheme in ("http", "https") and parsed.netloc:
+        return f"{parsed.scheme}://{parsed.netloc}"
+    return None
+
+
+def _track_origins(nova):
+    """Record the origin of every navigation in the browser, so a reset can clear all of them."""
+    origins = _visited_origins.setdefault(id(nova), set())
+
+    def on_navigated(frame):
+        origin = _origin(frame.url)
+        if origin:
+            origins.add(origin)
+
+    def watch(page):
+        page.on("framenavigated", on_navigated)
+
+    context = nova.page.context
+    for page in context.pages:
+        watch(page)
+    context.on("page", watch)
+    # The starting page loaded before the listener was attached
+    on_navigated(nova.page)
+
+
+def _forget_origins(nova):
+    _visited_origins.pop(id(nova), None)
+
+
+def _reset_browser_state(nova):
+    """Clear cookies and the storage of every origin visited since the last reset."""
+    page = nova.page
+    origins = _visited_origins.setdefault(id(nova), set())
+    current_origin = _origin(page.url)
+    if current_origin:
+        origins.add(current_origin)
+    cdp = page.context.new_cdp_session(page)
+    try:
+        for origin in origins:
+            cdp.send("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    finally:
+        cdp.detach()
+    page.context.clear_cookies()
+    origins.clear()
+
+
+def _stop_browser(nova):
+    _forget_origins(nova)
+    try:
+        nova.stop()
+    except Exception as e:
+        logger.warning(f"Failed to stop the browser: {e}")
+
+
+def _stop_warm_browser():
+    global _warm_nova
+    if _warm_nova is not None:
+        _forget_origins(_warm_nova)
+        try:
+            _warm_nova.stop()
+        except Exception as e:
+            logger.warning(f"Failed to stop the warm browser: {e}")
+        _warm_nova = None
+
+
+def get_warm_nova_act(api_key, starting_page):
+    """Return the warm NovaAct on `starting_page`, relaunching it if the browser has died."""
+    global _warm_nova
+    load_nova_act()
+    if _warm_nova is not None and not _is_browser_alive(_warm_nova):
+        logger.warning("Warm browser is not responding, relaunching")
+        _stop_warm_browser()
+
+    if _warm_nova is None:
+        logger.info("Launching warm browser")
+        _warm_nova = NovaAct(
+            starting_page=starting_page,
+            nova_act_api_key=api_key,
+            headless=True,
+            chrome_channel="chromium",
+        )
+        _warm_nova.start()
+        _track_origins(_warm_nova)
+    else:
+        logger.info("Reusing warm browser")
+        try:
+            _reset_browser_state(_warm_nova)
+            _warm_nova.go_to_url(starting_page)
+        except Exception as e:
+            logger.warning(f"Failed to reset the warm browser, relaunching: {e}")
+            _stop_warm_browser()
+            return get_warm_nova_act(api_key, starting_page)
+    return _warm_nova
+
+
+def _remaining_seconds(context):
+    """Seconds left for work before the Lambda deadline, or None outside of Lambda."""
+    if context is None or not hasattr(context, "get_remaining_time_in_millis"):
+        return None
+    return (context.get_remaining_time_in_millis() - DEADLINE_RESERVE_MS) / 1000
+
+
+def handle_batch(tasks, api_key, context):
+    """Run a list of tasks on one browser, stopping cleanly before the Lambda deadline."""
+    results = []
+    batch_nova = None
+    try:
+        for index, task in enumerate(tasks):
+            if not isinstance(task, dict):
+                logger.error(f"Task {index} is not a JSON object")
+                results.append({
+                    "prompt": None,
+                    "starting_page": None,
+                    "status": "error",
+                    "response": f"Task must be a JSON object, got {type(task).__name__}",
+                    "duration_ms": 0,
+                })
+                continue
+            prompt = task.get("prompt", DEFAULT_PROMPT)
+            starting_page = task.get("starting_page", DEFAULT_STARTING_PAGE)
+            item = {"prompt": prompt, "starting_page": starting_page}
+
+            remaining = _remaining_seconds(context)
+            if remaining is not None and remaining < 1:
+                logger.warning(f"Skipping task {index}: Lambda deadline is too close")
+                results.append(item | {
+                    "status": "skipped",
+                    "response": "Not enough time left before the Lambda deadline",
+                    "duration_ms": 0,
+                })
+                continue
+
+            logger.info(f"Running task {index}: {prompt} on {starting_page}")
+            started = time.monotonic()
+            try:
+                if WARM_BROWSER:
+                    nova = get_warm_nova_act(api_key, starting_page)
+                elif batch_nova is None:
+                    browser = NovaAct(
+                        starting_page=starting_page,
+                        nova_act_api_key=api_key,
+                        headless=True,
+                        chrome_channel="chromium",
+                    )
+                    try:
+                        browser.start()
+                    except Exception:
+                        _stop_browser(browser)
+                        raise
+                    # Only keep a browser that started
+                    batch_nova = browser
+                    _track_origins(batch_nova)
+                    nova = batch_nova
+                else:
+                    _reset_browser_state(batch_nova)
+                    batch_nova.go_to_url(starting_page)
+                    nova = batch_nova
+
+                result = nova.act(
+                    prompt, timeout=int(remaining) if remaining is not None else None
+                )
+                item |= {"status": "success", "response": str(result)}
+            except Exception as e:
+                logger.error(f"Task {index} failed: {str(e)}")
+                item |= {"status": "error", "response": str(e)}
+                if batch_nova is not None and not _is_browser_alive(batch_nova):
+                    dead_browser, batch_nova = batch_nova, None
+                    _stop_browser(dead_browser)
+            item["duration_ms"] = int((time.monotonic() - started) * 1000)
+            results.append(item)
+    finally:
+        if batch_nova is not None:
+            # A failing stop must not hide the results, or the error that is being raised
+            _stop_browser(batch_nova)
+
+    succeeded = sum(1 for item in results if item["status"] == "success")
+    return {
+        "status": "success" if succeeded == len(results) else "partial",
+        "succeeded": succeeded,
+        "total": len(results),
+        "results": results,
+    }
+
 
 def handler(event, context):
-    logger.info(f"Handler started - Event received: {event} with context: {context}")
+    global _invocations
+    _invocations += 1
+    with profiler.phase("invocation"):
+        response = _handle(event, context)
+    if _invocations == 1:
+        profiler.report("first_invocation")
+    return response
+
+
+def _handle(event, context):
+    logger.info(
+        "Handler started",
+        extra={"event": event, "request_id": getattr(context, "aws_request_id", None)},
+    )
     
     try:
         # Get API key from environment
@@ -21,42 +320,50 @@ def handler(event, context):
         if not api_key:
             raise ValueError("NOVA_ACT_API_KEY environment variable is required")
 
+        load_nova_act()
+
+        # Batch events carry a list of tasks that share one browser
+        if isinstance(event, dict) and "tasks" in event:
+            if not isinstance(event["tasks"], list):
+                raise ValueError("tasks must be a list of JSON objects")
+            return handle_batch(event["tasks"], api_key, context)
+
         # Extract parameters with defaults
-        default_prompt = "Find flights from Boston to Wolf on Feb 22nd"
-        default_starting_page = "https://nova.amazon.com/act/gym/next-dot/search"
         if isinstance(event, dict):
-            prompt = event.get("prompt", default_prompt)
-            starting_page = event.get("starting_page", default_starting_page)
+            prompt = event.get("prompt", DEFAULT_PROMPT)
+            starting_page = event.get("starting_page", DEFAULT_STARTING_PAGE)
         else:
-            prompt = default_prompt
-            starting_page = default_starting_page
+            prompt = DEFAULT_PROMPT
+            starting_page = DEFAULT_STARTING_PAGE
 
         logger.info("Starting Nova Act...")
         logger.info(f"Prompt: {prompt}")
         logger.info(f"Starting page: {starting_page}")
 
-        with NovaAct(
-            starting_page=starting_page,
-            nova_act_api_key=api_key,
-            headless=True,
-            chrome_channel="chromium",
-        ) as nova:
+        if WARM_BROWSER:
+            nova = get_warm_nova_act(api_key, starting_page)
             logger.info("Invoking Nova Act")
             result = nova.act(prompt)
-            logger.info(f"Nova Act result: {result}")
-            
-            return {
-                "status": "success",
-                "response": str(result),
-                "prompt": prompt,
-                "starting_page": starting_page
-            }
+        else:
+            with NovaAct(
+                starting_page=starting_page,
+                nova_act_api_key=api_key,
+                headless=True,
+                chrome_channel="chromium",
+            ) as nova:
+                logger.info("Invoking Nova Act")
+                result = nova.act(prompt)
+        logger.info(f"Nova Act result: {result}")
+
+        return {
+            "status": "success",
+            "response": str(result),
+            "prompt": prompt,
+            "starting_page": starting_page
+        }
             
     except Exception as e:
-        logger.error(f"Error occurred: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception(f"Error occurred: {str(e)}")
         return {
             "status": "error", 
             "response": str(e),
@@ -64,4 +371,23 @@ def handler(event, context):
             "starting_page": event.get("starting_page", "") if isinstance(event, dict) else ""
         }
     finally:
-        logger.info("Shutting down...")
\ No newline at end of file
+        logger.info("Shutting down...")
+        # Lambda freezes the environment once the handler returns, so write out queued records first
+        _log_queue.join()
+
+
+def _init():
+    """Runs during the Lambda init phase, doing only the work NOVA_ACT_EAGER_INIT asks for."""
+    with profiler.phase("init"):
+        if EAGER_INIT in ("imports", "browser"):
+            load_nova_act()
+        if EAGER_INIT == "browser":
+            api_key = os.environ.get("NOVA_ACT_API_KEY")
+            if api_key:
+                get_warm_nova_act(api_key, DEFAULT_STARTING_PAGE)
+            else:
+                logger.warning("NOVA_ACT_API_KEY is not set, skipping the eager browser launch")
+    profiler.report("init")
+
+
+_init()
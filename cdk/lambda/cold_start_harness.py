@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+"""
+Local harness that measures the Lambda cold start under each NOVA_ACT_EAGER_INIT setting.
+
+Every run starts a fresh Python process that imports app.py, which is the Lambda init phase, and
+then sends it one event, which is the first invocation. The profile lines written by
+cold_start_profiler.py are collected, and medians are reported per setting as JSON.
+
+Usage (from cdk/lambda, with the requirements installed and NOVA_ACT_API_KEY set):
+python cold_start_harness.py [--configs none imports browser] [--runs 5] [--event '<json>'] [--output cold_start.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent
+
+# Runs in the child process: init by importing the app, then invoke it once
+RUNNER = "import json, sys, app; app.handler(json.loads(sys.argv[1]), None)"
+
+
+def run_once(eager_init, event):
+    env = {**os.environ, "NOVA_ACT_PROFILE_COLD_START": "true", "NOVA_ACT_EAGER_INIT": eager_init}
+    started = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-c", RUNNER, json.dumps(event)],
+        cwd=APP_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    profiles = {}
+    for line in process.stdout.splitlines():
+        if '"cold_start_profile"' in line:
+            profile = json.loads(line)
+            profiles[profile["label"]] = profile
+    if process.returncode != 0 or not {"init", "first_invocation"} <= profiles.keys():
+        error = process.stderr.strip().splitlines()[-1:] or ["no profile written"]
+        raise RuntimeError(f"Run with NOVA_ACT_EAGER_INIT={eager_init} failed: {error[0]}")
+
+    init, first = profiles["init"], profiles["first_invocation"]
+    phases = {}
+    for phase in first["phases"]:
+        phases[phase["phase"]] = phases.get(phase["phase"], 0.0) + phase["duration_ms"]
+    return {
+        "wall_ms": wall_ms,
+        "init_ms": (init["before_profiler_ms"] or 0.0) + init["since_profiler_ms"],
+        "first_invocation_ms": phases.get("invocation", 0.0),
+        "import_ms": first["import_ms"],
+        "phases": phases,
+        "slowest_imports": first["slowest_imports"][:10],
+    }
+
+
+def summarize(eager_init, runs):
+    def median(values):
+        return round(statistics.median(values), 1)
+
+    phase_names = sorted({name for run in runs for name in run["phases"]})
+    return {
+        "eager_init": eager_init,
+        "runs": len(runs),
+        "median_wall_ms": median([run["wall_ms"] for run in runs]),
+        "median_init_ms": median([run["init_ms"] for run in runs]),
+        "median_first_invocation_ms": median([run["first_invocation_ms"] for run in runs]),
+        "median_cold_start_ms": median([run["init_ms"] + run["first_invocation_ms"] for run in runs]),
+        "median_import_ms": median([run["import_ms"] for run in runs]),
+        "median_phase_ms": {name: median([run["phases"].get(name, 0.0) for run in runs]) for name in phase_names},
+        # The slowest imports of the last run are representative, since imports barely vary
+        "slowest_imports": runs[-1]["slowest_imports"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Lambda cold start for each NOVA_ACT_EAGER_INIT setting")
+    parser.add_argument("--configs", nargs="+", default=["none", "imports", "browser"], choices=["none", "imports", "browser"])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes per setting")
+    parser.add_argument("--event", default="{}", help="JSON event for the first invocation")
+    parser.add_argument("--output", help="Also write the results to this file")
+    options = parser.parse_args()
+
+    event = json.loads(options.event)
+    results = []
+    for eager_init in options.configs:
+        runs = [run_once(eager_init, event) for _ in range(options.runs)]
+        result = summarize(eager_init, runs)
+        results.append(result)
+        print(
+            f"NOVA_ACT_EAGER_INIT={eager_init:<8} init {result['median_init_ms']:>9.1f} ms   "
+            f"first invocation {result['median_first_invocation_ms']:>9.1f} ms   "
+            f"cold start {result['median_cold_start_ms']:>9.1f} ms",
+            file=sys.stderr,
+        )
+
+    report = json.dumps({"python": sys.version.split()[0], "results": results}, indent=2)
+    if options.output:
+        Path(options.output).write_text(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+Cold start profiler for the Lambda container.
+
+Enabled with NOVA_ACT_PROFILE_COLD_START=true. It records:
+- the time each module takes to import, like `python -X importtime`, by wrapping the loaders that
+  the import system finds,
+- named phases such as the init phase and the first invocation,
+- the browser launch phases inside NovaAct.start() (Playwright startup, browser launch and the
+  first navigation).
+
+Each report is written to stdout as one JSON line with "type": "cold_start_profile", so it can be
+read from CloudWatch Logs Insights or by cold_start_harness.py.
+
+This module only uses the standard library. Import it before anything heavy, so those imports are
+timed too.
+"""
+
+import functools
+import importlib.abc
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+ENABLED = os.environ.get("NOVA_ACT_PROFILE_COLD_START", "false").lower() == "true"
+# Number of slowest imports included in each report
+TOP_IMPORTS = int(os.environ.get("NOVA_ACT_PROFILE_TOP_IMPORTS", "25"))
+
+
+
+def _process_age_seconds():
+    """Seconds since this process started, from /proc. None where /proc is not available."""
+    try:
+        with open("/proc/self/stat") as f:
+            # Field 22 is the start time in clock ticks since boot. Fields are counted after the
+            # parenthesised command name, which may contain spaces.
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return max(uptime - start_ticks / os.sysconf("SC_CLK_TCK"), 0.0)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# Phase start times are relative to when this module was imported
+_PROFILER_START = time.perf_counter()
+# Interpreter startup and anything imported before this module
+_BEFORE_PROFILER_SECONDS = _process_age_seconds()
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a module's loader to time its exec_module, excluding nested imports for self time."""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._start_import(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._finish_import()
+
+    def __getattr__(self, name):
+        # Loaders such as zipimport and namespace loaders expose more than exec_module
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """First entry on sys.meta_path. Asks the finders after it for a spec and times the loader."""
+
+    def __init__(self, profiler):
+        self._profiler = profiler
+        self._finding = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._finding, "active", False):
+            return None
+        self._finding.active = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self._profiler)
+                    return spec
+            return None
+        finally:
+            self._finding.active = False
+
+
+class ColdStartProfiler:
+    """Collects import timings and phases for the current process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._imports = []
+        self._import_stack = threading.local()
+        self._phases = []
+        self._finder = None
+        self._patched = False
+
+    def install(self):
+        """Starts timing imports. Browser launch phases are timed once Playwright is imported."""
+        if self._finder is None:
+            self._finder = _ImportTimer(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def _start_import(self, name):
+        stack = getattr(self._import_stack, "stack", None)
+        if stack is None:
+            stack = self._import_stack.stack = []
+        # [name, start, time spent in nested imports]
+        stack.append([name, time.perf_counter(), 0.0])
+
+    def _finish_import(self):
+        stack = self._import_stack.stack
+        name, started, nested = stack.pop()
+        cumulative = time.perf_counter() - started
+        if stack:
+            stack[-1][2] += cumulative
+        with self._lock:
+            self._imports.append(
+                {
+                    "module": name,
+                    "self_ms": round((cumulative - nested) * 1000, 2),
+                    "cumulative_ms": round(cumulative * 1000, 2),
+                    "parent": stack[-1][0] if stack else None,
+                }
+            )
+        if name == "playwright.sync_api" and not self._patched:
+            self._patch_playwright(sys.modules[name])
+
+    @contextmanager
+    def phase(self, name):
+        """Records how long the enclosed block takes, and when it started after the profiler was imported."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._phases.append(
+                    {
+                        "phase": name,
+                        "start_ms": round((started - _PROFILER_START) * 1000, 2),
+                        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                    }
+                )
+
+    def time_method(self, cls, method_name, phase_name):
+        """Records every call of `cls.method_name` as a phase."""
+        func = getattr(cls, method_name)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.phase(phase_name):
+                return func(*args, **kwargs)
+
+        setattr(cls, method_name, wrapper)
+
+    def _patch_playwright(self, sync_api):
+        """Times the steps of NovaAct.start() through the Playwright calls it makes."""
+        self._patched = True
+        targets = [
+            ("PlaywrightContextManager", "start", "browser.playwright_start"),
+            ("BrowserType", "launch", "browser.launch"),
+            ("BrowserType", "launch_persistent_context", "browser.launch"),
+            ("BrowserType", "connect_over_cdp", "browser.connect"),
+            ("Page", "goto", "browser.goto"),
+        ]
+        for class_name, method_name, phase_name in targets:
+            cls = getattr(sync_api, class_name, None)
+            if cls is None:
+                playwright_cm = sys.modules.get("playwright.sync_api._context_manager")
+                cls = getattr(playwright_cm, class_name, None)
+            if cls is not None and hasattr(cls, method_name):
+                self.time_method(cls, method_name, phase_name)
+
+    def report(self, label):
+        """Writes the phases and slowest imports recorded so far as one JSON line to stdout."""
+        with self._lock:
+            imports = list(self._imports)
+            phases = list(self._phases)
+        top_level = [entry for entry in imports if entry["parent"] is None]
+        report = {
+            "type": "cold_start_profile",
+            "label": label,
+            "before_profiler_ms": (
+                round(_BEFORE_PROFILER_SECONDS * 1000, 2) if _BEFORE_PROFILER_SECONDS is not None else None
+            ),
+            "since_profiler_ms": round((time.perf_counter() - _PROFILER_START) * 1000, 2),
+            "import_ms": round(sum(entry["cumulative_ms"] for entry in top_level), 2),
+            "modules_imported": len(imports),
+            "phases": phases,
+            "slowest_imports": sorted(imports, key=lambda entry: entry["self_ms"], reverse=True)[:TOP_IMPORTS],
+        }
+        sys.stdout.write(json.dumps(report) + "\n")
+        sys.stdout.flush()
+        return report
+
+
+class _DisabledProfiler:
+    """Stand-in used when profiling is off, so call sites don't need to check."""
+
+    def install(self):
+        pass
+
+    @contextmanager
+    def phase(self, name):
+        yield
+
+    def time_method(self, cls, method_name, phase_name):
+        pass
+
+    def report(self, label):
+        return None
+
+
+profiler = ColdStartProfiler() if ENABLED else _DisabledProfiler()
+profiler.install()
@@ -6,8 +6,6 @@ Usage:
 python -m examples.booking
 """
 
-import fire  # type: ignore
-
 from examples.utils import get_logger, get_workflow_kwargs
 
 from nova_act import NovaAct, workflow
@@ -42,4 +40,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    import fire  # type: ignore
+
     fire.Fire(main)
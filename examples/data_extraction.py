@@ -6,10 +6,14 @@ Usage:
 python -m examples.data_extraction --planet <planet name from https://nova.amazon.com/act/gym/next-dot/>
 """
 
-import fire  # type: ignore
 from pydantic import BaseModel
 
-from examples.utils import get_logger, get_workflow_kwargs
+from examples.utils import (
+    get_logger,
+    get_schema,
+    get_workflow_kwargs,
+    validate_response,
+)
 
 from nova_act import NovaAct, workflow
 
@@ -32,15 +36,17 @@ def main(planet: str = "Proxima Centauri b") -> None:
         # Extract the planet data
         result = nova.act_get(
             f"Go to the {planet} page and return the gravity and average temperature.",
-            schema=PlanetData.model_json_schema(),
+            schema=get_schema(PlanetData),
         )
 
         # Parse the response into the data model
-        planet_data = PlanetData.model_validate(result.parsed_response)
+        planet_data = validate_response(PlanetData, result.parsed_response)
 
         # Do something with the parsed data
         LOGGER.info(f"✓ {planet} data:\n{planet_data.model_dump_json(indent=2)}")
 
 
 if __name__ == "__main__":
+    import fire  # type: ignore
+
     fire.Fire(main)
@@ -7,10 +7,14 @@ python -m examples.flight_search
 """
 
 from datetime import datetime, timedelta
-import fire  # type: ignore
 from pydantic import BaseModel
 
-from examples.utils import get_logger, get_workflow_kwargs
+from examples.utils import (
+    get_logger,
+    get_schema,
+    get_workflow_kwargs,
+    validate_response,
+)
 
 from nova_act import NovaAct, workflow
 
@@ -33,15 +37,17 @@ def main(origin: str = "Boston", destination: str = "Wolf", date: str | None = N
         # Search and extract the flight data
         result = nova.act_get(
             f"Find flights from {origin} to {destination} on {date} and return the cheapest one.",
-            schema=Flight.model_json_schema(),
+            schema=get_schema(Flight),
         )
 
         # Parse the response into the data model
-        flight = Flight.model_validate(result.parsed_response)
+        flight = validate_response(Flight, result.parsed_response)
 
         # Do something with the parsed data
         LOGGER.info(f"✓ Flight data:\n{flight.model_dump_json(indent=2)}")
 
 
 if __name__ == "__main__":
+    import fire  # type: ignore
+
     fire.Fire(main)
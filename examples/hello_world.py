@@ -6,8 +6,6 @@ Usage:
 python -m examples.hello_world
 """
 
-import fire  # type: ignore
-
 from examples.utils import get_workflow_kwargs
 
 from nova_act import NovaAct, workflow
@@ -22,4 +20,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    import fire  # type: ignore
+
     fire.Fire(main)
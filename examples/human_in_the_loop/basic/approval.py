@@ -3,11 +3,12 @@
 See the README for more details.
 
 Usage:
-python -m examples.human_in_the_loop.basic.approval
+python -m examples.human_in_the_loop.basic.approval [--policy_file <approval_policy.json>]
 """
 
 from pathlib import Path
 
+from examples.human_in_the_loop.basic.approval_policy import PolicyApprovalMixin, load_policy
 from examples.utils import get_logger, get_workflow_kwargs
 
 from nova_act import NovaAct, SecurityOptions, workflow
@@ -46,12 +47,24 @@ class ApprovalCallbacks(HumanInputCallbacksBase):
         raise NoHumanInputToolAvailable(message)
 
 
+class PolicyApprovalCallbacks(PolicyApprovalMixin, ApprovalCallbacks):
+    """
+    Answers approval requests from a policy file, prompting the user only when the policy says to ask
+    """
+
+
 @workflow(**get_workflow_kwargs())
-def main():
+def main(policy_file: str | None = None):
+    """Purchase a T Shirt, asking for approval before completing the order.
+
+    Args:
+        policy_file: JSON or YAML approval policy that decides routine requests without prompting
+    """
+    callbacks = PolicyApprovalCallbacks(load_policy(policy_file)) if policy_file else ApprovalCallbacks()
     with NovaAct(
         starting_page=f"file://{Path(__file__).parent.absolute() / 'ui' / 'checkout.html'}",
         security_options=SecurityOptions(allow_file_urls=True),
-        human_input_callbacks=ApprovalCallbacks(),
+        human_input_callbacks=callbacks,
         tty=False,
     ) as nova:
         result = nova.act_get(
@@ -60,6 +73,11 @@ def main():
         order_number = result.parsed_response
         LOGGER.info(f"✓ Purchase complete with: {order_number}")
 
+    if policy_file:
+        LOGGER.info(f"Approval wait by decision source: {callbacks.wait_summary()}")
+
 
 if __name__ == "__main__":
-    main()
+    import fire  # type: ignore
+
+    fire.Fire(main)
@@ -0,0 +1,338 @@
+"""Demonstrates an approval broker that lets many Nova Act sessions wait for a reviewer at once.
+
+Approval requests from every session are posted to a local web page (and JSON API) where a reviewer
+approves or denies them in any order. Each session waits on its own future, so one slow decision
+never holds up the others. Requests that are not answered within the timeout are denied.
+
+The API requires a secret token that is only printed to the terminal, as part of the review page
+link. The agent's browser runs on the same host, so without the token a prompt-injected act could
+open the review page and approve its own request.
+
+See the README for more details.
+
+Usage:
+python -m examples.human_in_the_loop.basic.approval_broker [--sessions <count>] [--port <port>] [--timeout_seconds <seconds>]
+"""
+
+import contextvars
+import hmac
+import json
+import secrets
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+from examples.utils import get_logger, get_workflow_kwargs
+
+from nova_act import NovaAct, SecurityOptions, workflow
+from nova_act.tools.human.interface.human_input_callback import (
+    ApprovalResponse,
+    HumanInputCallbacksBase,
+    UiTakeoverResponse,
+)
+from nova_act.types.act_errors import NoHumanInputToolAvailable
+
+LOGGER = get_logger(__name__)
+
+REVIEW_PAGE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Nova Act approvals</title>
+<style>
+body { font-family: sans-serif; margin: 2em; }
+.request { border: 1px solid #ccc; border-radius: 6px; padding: 1em; margin-bottom: 1em; }
+.meta { color: #666; font-size: 0.85em; margin-bottom: 0.5em; }
+button { margin-right: 0.5em; }
+</style>
+</head>
+<body>
+<h1>Pending approvals</h1>
+<div id="requests"><p>No pending requests.</p></div>
+<script>
+// The token is in the URL fragment, which is never sent to the server or in a Referer header
+const token = new URLSearchParams(location.hash.slice(1)).get("token") || "";
+const headers = {"X-Approval-Token": token};
+async function decide(id, decision) {
+  await fetch("/approvals/" + id, {method: "POST", headers, body: JSON.stringify({decision})});
+  refresh();
+}
+async function refresh() {
+  const container = document.getElementById("requests");
+  const response = await fetch("/approvals", {headers});
+  if (!response.ok) { container.innerHTML = "<p>Open the review link printed in the terminal.</p>"; return; }
+  const requests = await response.json();
+  container.replaceChildren();
+  if (!requests.length) { container.innerHTML = "<p>No pending requests.</p>"; return; }
+  for (const request of requests) {
+    const div = document.createElement("div");
+    div.className = "request";
+    const meta = document.createElement("div");
+    meta.className = "meta";
+    meta.textContent = `session ${request.act_session_id} · act ${request.act_id} · waiting ${Math.round(request.waiting_seconds)}s of ${request.timeout_seconds}s`;
+    const message = document.createElement("p");
+    message.textContent = request.message;
+    div.append(meta, message);
+    for (const [label, decision] of [["Approve", "approve"], ["Deny", "deny"]]) {
+      const button = document.createElement("button");
+      button.textContent = label;
+      button.onclick = () => decide(request.id, decision);
+      div.append(button);
+    }
+    container.append(div);
+  }
+}
+refresh();
+setInterval(refresh, 2000);
+</script>
+</body>
+</html>
+"""
+
+
+class PendingApproval:
+    """An approval request waiting for a reviewer's decision."""
+
+    def __init__(self, message: str, act_id: str | None, act_session_id: str | None, timeout_seconds: float):
+        self.id = uuid.uuid4().hex
+        self.message = message
+        self.act_id = act_id
+        self.act_session_id = act_session_id
+        self.timeout_seconds = timeout_seconds
+        self.created_at = time.monotonic()
+        self.future: Future[ApprovalResponse] = Future()
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "message": self.message,
+            "act_id": self.act_id,
+            "act_session_id": self.act_session_id,
+            "waiting_seconds": time.monotonic() - self.created_at,
+            "timeout_seconds": self.timeout_seconds,
+        }
+
+
+class ApprovalBroker:
+    """
+    Queues approval requests from any number of sessions and serves them to reviewers over HTTP.
+
+    GET  /                  Review page
+    GET  /approvals         Pending requests as JSON
+    POST /approvals/<id>    Decide a request with a JSON body of {"decision": "approve" | "deny"}
+
+    The API requires the broker's token in an X-Approval-Token header. POSTs from a browser must
+    also come from the review page's own origin.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, timeout_seconds: float = 300):
+        self.timeout_seconds = timeout_seconds
+        # Only shown in the terminal, as part of review_url
+        self.token = secrets.token_urlsafe(32)
+        self._pending: dict[str, PendingApproval] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def review_url(self) -> str:
+        """The review page link, including the token the page needs to call the API."""
+        return f"{self.url}#token={self.token}"
+
+    def _allowed_origins(self) -> set[str]:
+        host, port = self._server.server_address[:2]
+        origins = {f"http://{host}:{port}"}
+        if host == "127.0.0.1":
+            origins.add(f"http://localhost:{port}")
+        return origins
+
+    def start(self) -> "ApprovalBroker":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        LOGGER.info(f"Approval broker is waiting for reviewers at {self.review_url}")
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        # Nobody is left to answer, so deny whatever is still waiting
+        with self._lock:
+            pending, self._pending = list(self._pending.values()), {}
+        for approval in pending:
+            if not approval.future.done():
+                approval.future.set_result(ApprovalResponse.CANCEL)
+
+    def __enter__(self) -> "ApprovalBroker":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def pending(self) -> list[dict]:
+        with self._lock:
+            return [approval.to_dict() for approval in self._pending.values()]
+
+    def request(
+        self,
+        message: str,
+        act_id: str | None = None,
+        act_session_id: str | None = None,
+        timeout_seconds: float | None = None,
+    ) -> ApprovalResponse:
+        """Blocks the calling session until a reviewer decides, denying the request on timeout."""
+        timeout_seconds = self.timeout_seconds if timeout_seconds is None else timeout_seconds
+        approval = PendingApproval(message, act_id, act_session_id, timeout_seconds)
+        with self._lock:
+            self._pending[approval.id] = approval
+        LOGGER.info(f"Approval {approval.id} requested by act_session_id {act_session_id}: {message}")
+        try:
+            response = approval.future.result(timeout=timeout_seconds)
+        except FutureTimeoutError:
+            LOGGER.warning(f"Approval {approval.id} timed out after {timeout_seconds}s, denying")
+            response = ApprovalResponse.CANCEL
+        finally:
+            with self._lock:
+                self._pending.pop(approval.id, None)
+        LOGGER.info(
+            f"Approval {approval.id} resolved as {response} after {time.monotonic() - approval.created_at:.1f}s"
+        )
+        return response
+
+    def decide(self, approval_id: str, approved: bool) -> bool:
+        """Resolves a pending request. Returns False if it no longer exists."""
+        with self._lock:
+            approval = self._pending.pop(approval_id, None)
+        if approval is None or approval.future.done():
+            return False
+        approval.future.set_result(ApprovalResponse.YES if approved else ApprovalResponse.CANCEL)
+        return True
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        broker = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status: int, body: str, content_type: str = "application/json") -> None:
+                payload = body.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _authorized(self) -> bool:
+                token = self.headers.get("X-Approval-Token", "")
+                if not hmac.compare_digest(token.encode(), broker.token.encode()):
+                    self._send(403, json.dumps({"error": "missing or invalid X-Approval-Token"}))
+                    return False
+                return True
+
+            def _same_origin(self) -> bool:
+                # Browsers send Origin (or at least Referer) on a POST. API clients may send neither.
+                origin = self.headers.get("Origin")
+                if origin is None and self.headers.get("Referer"):
+                    referer = urlparse(self.headers["Referer"])
+                    origin = f"{referer.scheme}://{referer.netloc}"
+                if origin is not None and origin not in broker._allowed_origins():
+                    self._send(403, json.dumps({"error": "cross-origin requests are not allowed"}))
+                    return False
+                return True
+
+            def do_GET(self) -> None:
+                if self.path == "/":
+                    self._send(200, REVIEW_PAGE, "text/html")
+                elif self.path == "/approvals":
+                    if self._authorized():
+                        self._send(200, json.dumps(broker.pending()))
+                else:
+                    self._send(404, json.dumps({"error": "not found"}))
+
+            def do_POST(self) -> None:
+                prefix = "/approvals/"
+                if not self.path.startswith(prefix):
+                    self._send(404, json.dumps({"error": "not found"}))
+                    return
+                if not self._same_origin() or not self._authorized():
+                    return
+                try:
+                    length = min(int(self.headers.get("Content-Length", 0)), 4096)
+                    decision = json.loads(self.rfile.read(length) or b"{}").get("decision")
+                except (ValueError, AttributeError):
+                    decision = None
+                if decision not in ("approve", "deny"):
+                    self._send(400, json.dumps({"error": "decision must be 'approve' or 'deny'"}))
+                    return
+                if broker.decide(self.path[len(prefix):], decision == "approve"):
+                    self._send(200, json.dumps({"status": "ok"}))
+                else:
+                    self._send(404, json.dumps({"error": "no pending request with that id"}))
+
+            def log_message(self, format: str, *args) -> None:
+                LOGGER.debug(format % args)
+
+        return Handler
+
+
+class BrokeredApprovalCallbacks(HumanInputCallbacksBase):
+    """
+    Implements an approve() callback which waits for a reviewer through an ApprovalBroker
+    """
+
+    def __init__(self, broker: ApprovalBroker, timeout_seconds: float | None = None) -> None:
+        super().__init__()
+        self.broker = broker
+        self.timeout_seconds = timeout_seconds
+
+    def approve(self, message: str) -> ApprovalResponse:
+        return self.broker.request(message, self.current_act_id, self.act_session_id, self.timeout_seconds)
+
+    def ui_takeover(self, message: str) -> UiTakeoverResponse:
+        """See ui_takeover.py for a UI Takeover example"""
+        raise NoHumanInputToolAvailable(message)
+
+
+def purchase(broker: ApprovalBroker, session_number: int) -> None:
+    with NovaAct(
+        starting_page=f"file://{Path(__file__).parent.absolute() / 'ui' / 'checkout.html'}",
+        security_options=SecurityOptions(allow_file_urls=True),
+        human_input_callbacks=BrokeredApprovalCallbacks(broker),
+        tty=False,
+    ) as nova:
+        result = nova.act_get(
+            "Purchase the T Shirt. Ask for approval before order completion and return the order number."
+        )
+        LOGGER.info(f"✓ Session {session_number} purchase complete with: {result.parsed_response}")
+
+
+@workflow(**get_workflow_kwargs())
+def main(sessions: int = 3, port: int = 8765, timeout_seconds: float = 300):
+    """Run several checkout sessions that all wait on the same approval broker.
+
+    Args:
+        sessions: Number of concurrent Nova Act sessions (default: 3)
+        port: Port for the review page on 127.0.0.1 (default: 8765)
+        timeout_seconds: Seconds to wait for a decision before denying (default: 300)
+    """
+    with ApprovalBroker(port=port, timeout_seconds=timeout_seconds) as broker:
+        with ThreadPoolExecutor(max_workers=sessions) as executor:
+            # Each session runs in a copy of this context so it is part of the active @workflow
+            futures = [
+                executor.submit(contextvars.copy_context().run, purchase, broker, i)
+                for i in range(1, sessions + 1)
+            ]
+            for future in futures:
+                future.result()
+
+
+if __name__ == "__main__":
+    import fire  # type: ignore
+
+    fire.Fire(main)
@@ -0,0 +1,198 @@
+"""Rule-based approval policy that answers routine approval requests without a human.
+
+A policy is a list of rules checked in order against each approval message. The first matching rule
+decides the request: approve, deny, or ask a human. Order matters, so put deny rules before broader
+rules that would also match, such as a purchase rule whose pattern includes "order". When a human
+is asked, the rule can remember the answer for the rest of the act or the session (optionally for
+a limited time), so a repeat of the same request is answered immediately. A remembered answer only
+covers requests for the same amount, so approving $60 never approves $6,000. Every decision
+records how long it waited.
+
+Policy files are JSON or YAML (YAML requires `pip install pyyaml`):
+
+{
+  "default": "ask",
+  "rules": [
+    {"name": "deletions", "pattern": "delete|remove", "decision": "deny"},
+    {"name": "small purchases", "pattern": "purchase|order", "max_amount": 50, "decision": "approve"},
+    {"name": "medium purchases", "pattern": "purchase|order", "max_amount": 500, "decision": "ask", "remember": "session", "ttl_seconds": 600},
+    {"name": "large purchases", "pattern": "purchase|order", "decision": "ask"}
+  ]
+}
+
+See approval_policy.json for an example.
+"""
+
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel
+
+from examples.utils import get_logger
+
+from nova_act.tools.human.interface.human_input_callback import ApprovalResponse
+
+LOGGER = get_logger(__name__)
+
+# Currency amounts such as "$1,299.00", "USD 45" or "45.50 EUR"
+AMOUNT_PATTERN = re.compile(
+    r"(?:[$€£]|\b(?:USD|EUR|GBP)\s?)\s?(\d[\d,]*(?:\.\d+)?)|(\d[\d,]*(?:\.\d+)?)\s?(?:USD|EUR|GBP)\b",
+    re.IGNORECASE,
+)
+
+Decision = Literal["approve", "deny", "ask"]
+# (rule name, scope, scope id, amount)
+RememberKey = tuple[str, str, str | None, float | None]
+
+
+class ApprovalRule(BaseModel):
+    """Matches approval messages and decides them, or says to ask a human."""
+
+    name: str
+    # Regular expression searched for in the message, case-insensitive
+    pattern: str | None = None
+    # Bounds on the largest currency amount in the message. A rule with bounds never matches a
+    # message without an amount.
+    min_amount: float | None = None
+    max_amount: float | None = None
+    decision: Decision
+    # For "ask" rules, how long a human's answer is reused for later matching requests with the
+    # same amount
+    remember: Literal["none", "act", "session"] = "none"
+    ttl_seconds: float | None = None
+
+    def matches(self, message: str, amount: float | None) -> bool:
+        if self.pattern and not re.search(self.pattern, message, re.IGNORECASE):
+            return False
+        if self.min_amount is not None or self.max_amount is not None:
+            if amount is None:
+                return False
+            if self.min_amount is not None and amount < self.min_amount:
+                return False
+            if self.max_amount is not None and amount > self.max_amount:
+                return False
+        return True
+
+
+class ApprovalPolicy(BaseModel):
+    """Rules checked in order. Messages no rule matches are decided by `default`."""
+
+    rules: list[ApprovalRule] = []
+    default: Decision = "ask"
+
+
+def load_policy(path: str | Path) -> ApprovalPolicy:
+    """Load an approval policy from a JSON or YAML file."""
+    path = Path(path)
+    if path.suffix == ".json":
+        return ApprovalPolicy.model_validate_json(path.read_text())
+    try:
+        import yaml  # type: ignore
+    except ImportError:
+        raise ImportError(f"PyYAML is required to load {path}: pip install pyyaml")
+    return ApprovalPolicy.model_validate(yaml.safe_load(path.read_text()))
+
+
+def extract_amount(message: str) -> float | None:
+    """The largest currency amount mentioned in `message`, if any."""
+    amounts = [
+        float((match.group(1) or match.group(2)).replace(",", ""))
+        for match in AMOUNT_PATTERN.finditer(message)
+    ]
+    return max(amounts) if amounts else None
+
+
+class PolicyApprovalMixin:
+    """
+    Puts an ApprovalPolicy in front of the approve() callback of a HumanInputCallbacksBase subclass.
+
+    List it before the class whose approve() asks a human, which is only called when the policy says
+    to ask and no remembered answer applies:
+
+        class PolicyApprovalCallbacks(PolicyApprovalMixin, ApprovalCallbacks):
+            pass
+
+        callbacks = PolicyApprovalCallbacks(load_policy("approval_policy.json"))
+    """
+
+    def __init__(self, policy: ApprovalPolicy, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.policy = policy
+        # (rule name, scope, scope id, amount) -> (response, expiry as time.monotonic(), or None)
+        self._remembered: dict[RememberKey, tuple[ApprovalResponse, float | None]] = {}
+        self._lock = threading.Lock()
+        self.decisions: list[dict] = []
+
+    def approve(self, message: str) -> ApprovalResponse:
+        started = time.monotonic()
+        amount = extract_amount(message)
+        rule = next((rule for rule in self.policy.rules if rule.matches(message, amount)), None)
+        decision = rule.decision if rule else self.policy.default
+
+        if decision != "ask":
+            response = ApprovalResponse.YES if decision == "approve" else ApprovalResponse.CANCEL
+            source = "rule"
+        else:
+            key = self._remember_key(rule, amount)
+            response = self._recall(key)
+            source = "remembered"
+            if response is None:
+                response = super().approve(message)
+                source = "human"
+                if key is not None:
+                    expires_at = started + rule.ttl_seconds if rule.ttl_seconds else None
+                    with self._lock:
+                        self._remembered[key] = (response, expires_at)
+
+        self._record(message, rule, source, response, time.monotonic() - started)
+        return response
+
+    def _remember_key(self, rule: ApprovalRule | None, amount: float | None) -> RememberKey | None:
+        if rule is None or rule.remember == "none":
+            return None
+        scope_id = self.current_act_id if rule.remember == "act" else self.act_session_id
+        # The amount is part of the key, so an answer is never reused for a different amount
+        return rule.name, rule.remember, scope_id, amount
+
+    def _recall(self, key: RememberKey | None) -> ApprovalResponse | None:
+        if key is None:
+            return None
+        with self._lock:
+            remembered = self._remembered.get(key)
+            if remembered is None:
+                return None
+            response, expires_at = remembered
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._remembered[key]
+                return None
+            return response
+
+    def _record(
+        self, message: str, rule: ApprovalRule | None, source: str, response: ApprovalResponse, wait_seconds: float
+    ) -> None:
+        decision = {
+            "message": message,
+            "rule": rule.name if rule else None,
+            "source": source,
+            "approved": response == ApprovalResponse.YES,
+            "wait_seconds": wait_seconds,
+        }
+        with self._lock:
+            self.decisions.append(decision)
+        LOGGER.info(
+            f"Approval {'granted' if decision['approved'] else 'denied'} by {source}"
+            f"{f' (rule {rule.name!r})' if rule else ''} after {wait_seconds:.2f}s"
+        )
+
+    def wait_summary(self) -> dict[str, dict]:
+        """Count and total wait per decision source (rule, remembered, human)."""
+        summary: dict[str, dict] = {}
+        with self._lock:
+            for decision in self.decisions:
+                stats = summary.setdefault(decision["source"], {"count": 0, "wait_seconds": 0.0})
+                stats["count"] += 1
+                stats["wait_seconds"] += decision["wait_seconds"]
+        return summary
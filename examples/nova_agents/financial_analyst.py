@@ -9,27 +9,17 @@ python -m examples.nova_agents.financial_analyst --website_url <url>
 """
 
 import os
-import fire
-from nova_act import NovaAct, workflow
+from nova_act import workflow
 from pydantic import BaseModel
-from strands import Agent, tool
-from strands_amazon_nova import NovaAPIModel
 
-from examples.utils import get_workflow_kwargs
-
-# Get and set Nova API key
-nova_api_key = os.environ.get("NOVA_API_KEY")
-if not nova_api_key:
-    raise ValueError("NOVA_API_KEY environment variable is required")
-
-# Initialize Nova Model Provider for Strands
-nova_model = NovaAPIModel(
-    api_key=nova_api_key,
-    model_id="nova-lite-v2",
-    params={"system_tools": ["nova_grounding"]},
+from examples.utils import (
+    agent_session,
+    get_schema,
+    get_workflow_kwargs,
+    run_in_agent_session,
+    validate_response,
 )
 
-
 # Define classes for structured output with Nova Act
 
 
@@ -45,41 +35,60 @@ class StockList(BaseModel):
     stocks: list[Stock]
 
 
+def _extract_stocks(nova, prompt: str) -> StockList:
+    result = nova.act_get(
+        prompt,
+        schema=get_schema(StockList),
+    )
+
+    return validate_response(StockList, result.parsed_response)
+
+
 # Define the Tool for strands to invoke to use Nova Act for research
-@tool
-@workflow(**get_workflow_kwargs())
 def extract_stock_symbols(website_url: str, prompt: str) -> StockList:
     """Returns a list of stock symbols from a website using Nova Act."""
-    with NovaAct(starting_page=website_url) as nova:
-        result = nova.act_get(
-            prompt,
-            schema=StockList.model_json_schema(),
-        )
+    return run_in_agent_session(_extract_stocks, website_url, prompt)
 
-        return StockList.model_validate(result.parsed_response)
-
-
-# Create the Strands agent with Nova Model Provider and Nova Act Tool
-agent = Agent(
-    model=nova_model,
-    tools=[extract_stock_symbols],
-    system_prompt=(
-        "You are a financial analyst specializing in stock analysis and market insights.\n\n"
-        "Your expertise includes:\n"
-        "- Analyzing individual stock performance and price movements\n"
-        "- Understanding market dynamics and sector trends\n"
-        "- Providing detailed insights into what drives stock performance\n"
-        "- Explaining market sentiment and technical indicators\n\n"
-        "When analyzing stocks, focus on:\n"
-        "- Recent price performance and volatility\n"
-        "- Sector and industry context\n"
-        "- Market conditions affecting the stock\n"
-        "- Technical patterns and trading volume\n"
-        "- Key factors driving current performance"
-    ),
-)
 
+def create_agent():
+    """Creates the Strands agent. Strands and the Nova model are only loaded when an agent is needed."""
+    from strands import Agent, tool
+    from strands_amazon_nova import NovaAPIModel
 
+    # Get and set Nova API key
+    nova_api_key = os.environ.get("NOVA_API_KEY")
+    if not nova_api_key:
+        raise ValueError("NOVA_API_KEY environment variable is required")
+
+    # Initialize Nova Model Provider for Strands
+    nova_model = NovaAPIModel(
+        api_key=nova_api_key,
+        model_id="nova-lite-v2",
+        params={"system_tools": ["nova_grounding"]},
+    )
+
+    # Create the Strands agent with Nova Model Provider and Nova Act Tool
+    return Agent(
+        model=nova_model,
+        tools=[tool(extract_stock_symbols)],
+        system_prompt=(
+            "You are a financial analyst specializing in stock analysis and market insights.\n\n"
+            "Your expertise includes:\n"
+            "- Analyzing individual stock performance and price movements\n"
+            "- Understanding market dynamics and sector trends\n"
+            "- Providing detailed insights into what drives stock performance\n"
+            "- Explaining market sentiment and technical indicators\n\n"
+            "When analyzing stocks, focus on:\n"
+            "- Recent price performance and volatility\n"
+            "- Sector and industry context\n"
+            "- Market conditions affecting the stock\n"
+            "- Technical patterns and trading volume\n"
+            "- Key factors driving current performance"
+        ),
+    )
+
+
+@workflow(**get_workflow_kwargs())
 def main(website_url: str, nova_act_prompt: str = "Find the top gainers"):
     """
     Run the financial analyst agent.
@@ -89,12 +98,17 @@ def main(website_url: str, nova_act_prompt: str = "Find the top gainers"):
         nova_act_prompt: Complete Nova Act prompt for stock extraction
     """
     # Extract stocks and analyze them
-    response = agent(
-        f"Extract stock symbols from {website_url} using the prompt '{nova_act_prompt}', then generate a report outlining each stocks performance. Analyze what's driving their current price movements, market sentiment, and key factors affecting their performance."
-    )
+    agent = create_agent()
+    # Every tool call in this run shares one browser session, which is stopped when the run ends
+    with agent_session(website_url):
+        response = agent(
+            f"Extract stock symbols from {website_url} using the prompt '{nova_act_prompt}', then generate a report outlining each stocks performance. Analyze what's driving their current price movements, market sentiment, and key factors affecting their performance."
+        )
 
     print(response)
 
 
 if __name__ == "__main__":
+    import fire
+
     fire.Fire(main)
\ No newline at end of file
@@ -10,25 +10,15 @@ python -m examples.nova_agents.travel_agent --num_destinations 5
 
 import os
 
-import fire
-from nova_act import NovaAct, workflow
+from nova_act import workflow
 from pydantic import BaseModel
-from strands import Agent, tool
-from strands_amazon_nova import NovaAPIModel
 
-from examples.utils import get_workflow_kwargs
-
-
-# Get and set Nova API key
-nova_api_key = os.environ.get("NOVA_API_KEY")
-if not nova_api_key:
-    raise ValueError("NOVA_API_KEY environment variable is required")
-
-# Initialize Nova Model Provider for Strands
-nova_model = NovaAPIModel(
-    api_key=nova_api_key,
-    model_id="nova-lite-v2",
-    params={"system_tools": ["nova_grounding"]},
+from examples.utils import (
+    agent_session,
+    get_schema,
+    get_workflow_kwargs,
+    run_in_agent_session,
+    validate_response,
 )
 
 
@@ -47,57 +37,79 @@ class DestinationList(BaseModel):
     destinations: list[Destination]
 
 
+STARTING_PAGE = "https://nova.amazon.com/act/gym/next-dot"
+
+
+def _extract_destinations(nova, num_destinations: int) -> list[str]:
+    result = nova.act_get(
+        f"Find the first {num_destinations} destinations",
+        schema=get_schema(DestinationList),
+    )
+
+    destinations = validate_response(DestinationList, result.parsed_response)
+    return [destination.name for destination in destinations.destinations]
+
+
 # Define the Tool for strands to invoke to use Nova Act for research
-@tool
-@workflow(**get_workflow_kwargs())
 def get_travel_destinations(num_destinations: int):
     """Returns a list of travel destinations from the web.
 
     Args:
         num_destinations: Number of destinations to retrieve from the page
     """
-    with NovaAct(starting_page="https://nova.amazon.com/act/gym/next-dot") as nova:
-        result = nova.act_get(
-            f"Find the first {num_destinations} destinations",
-            schema=DestinationList.model_json_schema(),
-        )
+    return run_in_agent_session(_extract_destinations, STARTING_PAGE, num_destinations)
 
-        destinations = DestinationList.model_validate(result.parsed_response)
-        destination_names = [
-            destination.name for destination in destinations.destinations
-        ]
-        return destination_names
-
-
-# Create the Strands agent with Nova Model Provider and Nova Act Tool
-agent = Agent(
-    model=nova_model,
-    tools=[get_travel_destinations],
-    system_prompt=(
-        "You are the galaxy's most sarcastic and enthusiastic interstellar travel agent!\n\n"
-        "Your expertise includes:\n"
-        "- Planning hilarious family trips with kids to sci-fi exoplanet destinations\n"
-        "- Writing entertaining reviews that mention actual science in parent language\n"
-        "- Finding activities kids would love OR reasons parents wouldn't want to leave\n"
-        "- Treating fictional exoplanets as real travel spots with humor and enthusiasm\n\n"
-        "For each destination, provide:\n"
-        "- A 2-word review title\n"
-        "- Star rating out of 5\n"
-        "- One funny review mentioning the actual science but in parent language\n"
-        "- One activity the kids would actually love OR one reason the parents wouldn't want to leave\n\n"
-        "This is completely fictional and fun - make these exoplanets feel like real travel destinations!"
-    ),
-)
 
+def create_agent():
+    """Creates the Strands agent. Strands and the Nova model are only loaded when an agent is needed."""
+    from strands import Agent, tool
+    from strands_amazon_nova import NovaAPIModel
+
+    # Get and set Nova API key
+    nova_api_key = os.environ.get("NOVA_API_KEY")
+    if not nova_api_key:
+        raise ValueError("NOVA_API_KEY environment variable is required")
+
+    # Initialize Nova Model Provider for Strands
+    nova_model = NovaAPIModel(
+        api_key=nova_api_key,
+        model_id="nova-lite-v2",
+        params={"system_tools": ["nova_grounding"]},
+    )
+
+    # Create the Strands agent with Nova Model Provider and Nova Act Tool
+    return Agent(
+        model=nova_model,
+        tools=[tool(get_travel_destinations)],
+        system_prompt=(
+            "You are the galaxy's most sarcastic and enthusiastic interstellar travel agent!\n\n"
+            "Your expertise includes:\n"
+            "- Planning hilarious family trips with kids to sci-fi exoplanet destinations\n"
+            "- Writing entertaining reviews that mention actual science in parent language\n"
+            "- Finding activities kids would love OR reasons parents wouldn't want to leave\n"
+            "- Treating fictional exoplanets as real travel spots with humor and enthusiasm\n\n"
+            "For each destination, provide:\n"
+            "- A 2-word review title\n"
+            "- Star rating out of 5\n"
+            "- One funny review mentioning the actual science but in parent language\n"
+            "- One activity the kids would actually love OR one reason the parents wouldn't want to leave\n\n"
+            "This is completely fictional and fun - make these exoplanets feel like real travel destinations!"
+        ),
+    )
 
+
+@workflow(**get_workflow_kwargs())
 def main(num_destinations: int = 5):
     print(
         f"🔍 Planning your trip with {num_destinations} destinations..."
     )
 
-    response = agent(
-        f"Get {num_destinations} sci-fi exoplanet travel destinations and plan a hilarious family trip that visits each of them."
-    )
+    agent = create_agent()
+    # Every tool call in this run shares one browser session, which is stopped when the run ends
+    with agent_session(STARTING_PAGE):
+        response = agent(
+            f"Get {num_destinations} sci-fi exoplanet travel destinations and plan a hilarious family trip that visits each of them."
+        )
 
     print("\n📖 Travel recommendations:")
     print("=" * 50)
@@ -105,4 +117,6 @@ def main(num_destinations: int = 5):
 
 
 if __name__ == "__main__":
+    import fire
+
     fire.Fire(main)
\ No newline at end of file
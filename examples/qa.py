@@ -2,6 +2,8 @@
 
 Runs a series of QA tests on a Nova Act gym.
 A `TEST_STEPS` data structure is declared and iterated over in the main function to execute the tests.
+Consecutive expected results with no action between them are checked together in a single
+`act_get()` call, and each one is still reported as passed or failed on its own.
 
 NOTE: Failed tests should be expected for example purposes.
 
@@ -9,8 +11,6 @@ Usage:
 python -m examples.qa
 """
 
-import fire  # type: ignore
-
 from examples.utils import get_logger, get_workflow_kwargs
 
 from nova_act import BOOL_SCHEMA, NovaAct, workflow
@@ -29,36 +29,77 @@ TEST_STEPS = [
 ]
 
 
+def group_test_steps(steps: list[dict]) -> list[tuple[str | None, list[tuple[int, str]]]]:
+    """Group steps into (action, [(step number, expected result), ...]).
+
+    A step with an action starts a new group, and every expected result up to the next action
+    is checked against the same page.
+    """
+    groups: list[tuple[str | None, list[tuple[int, str]]]] = []
+    for i, step in enumerate(steps, 1):
+        action = step.get("action")
+        if action or not groups:
+            groups.append((action, []))
+        if step.get("expected_result"):
+            groups[-1][1].append((i, step["expected_result"]))
+    return groups
+
+
+def check_expected_results(nova: NovaAct, expectations: list[tuple[int, str]]) -> dict[int, bool]:
+    """Check every expectation in one act_get() call and return pass/fail by step number."""
+    if len(expectations) == 1:
+        i, expected_result = expectations[0]
+        result = nova.act_get(expected_result, schema=BOOL_SCHEMA)
+        return {i: result.parsed_response is True}
+
+    # One boolean property per assertion, so the page is only inspected once
+    schema = {
+        "type": "object",
+        "properties": {
+            f"step_{i}": {"type": "boolean", "description": expected_result}
+            for i, expected_result in expectations
+        },
+        "required": [f"step_{i}" for i, _ in expectations],
+    }
+    statements = "\n".join(f"step_{i}: {expected_result}" for i, expected_result in expectations)
+    result = nova.act_get(
+        "For each of the following statements, return whether it is true on the current page.\n"
+        f"{statements}",
+        schema=schema,
+    )
+    actual = result.parsed_response if isinstance(result.parsed_response, dict) else {}
+    return {i: actual.get(f"step_{i}") is True for i, _ in expectations}
+
+
 @workflow(**get_workflow_kwargs())
 def main() -> None:
     with NovaAct(starting_page="https://nova.amazon.com/act/gym/next-dot/") as nova:
-        # Iterate over the test steps
-        for i, step in enumerate(TEST_STEPS, 1):
-            # Get this step's action and expected result
-            action = step.get("action")
-            expected_result = step.get("expected_result")
-
+        # Iterate over groups of test steps that share a page
+        for action, expectations in group_test_steps(TEST_STEPS):
             LOGGER.info(
-                f"\nStep {i}: Processing action='{action}', expected='{expected_result}'\n"
+                f"\nProcessing action='{action}', expected={[e for _, e in expectations]}\n"
             )
 
             # Execute the test action
             if action:
                 nova.act(action)
 
-            # Extract and assert the expected result
-            if expected_result:
-                # Use act_get() to extract the actual result from the page. Extend this to extract other data types using the `schema` argument!
-                result = nova.act_get(expected_result, schema=BOOL_SCHEMA)
-                actual = result.parsed_response
-                expected = True
+            # Extract and assert the expected results. Extend this to extract other data types using the `schema` argument!
+            if expectations:
+                passed = check_expected_results(nova, expectations)
+                for i, expected_result in expectations:
+                    if passed[i]:
+                        LOGGER.info(f"✓ Step {i} passed: '{expected_result}'")
+                    else:
+                        LOGGER.error(f"✗ Step {i} failed: '{expected_result}'")
 
+                failed = [i for i, _ in expectations if not passed[i]]
                 assert (
-                    actual is expected
-                ), f"Test step {i} failed: Expected '{expected}' but got '{actual}' for action '{action}' and expected result '{expected_result}'"
-
-            LOGGER.info(f"✓ Step {i} passed\n")
+                    not failed
+                ), f"Test steps {failed} failed: expected results were not met after action '{action}'"
 
 
 if __name__ == "__main__":
+    import fire  # type: ignore
+
     fire.Fire(main)
@@ -0,0 +1,241 @@
+"""Run a suite of QA test files in parallel.
+
+Loads QA tests from JSON or YAML files and runs them across a pool of browser processes. A
+failing step does not stop the suite. Results are written as JUnit XML with the latency of every
+step, and the slowest steps are logged at the end of the run.
+
+Each test file has a `name`, a `starting_page` and a list of `steps` in the same format as
+`TEST_STEPS` in qa.py. See qa_tests/ for examples. YAML files require PyYAML (`pip install pyyaml`).
+
+Usage:
+python -m examples.qa_suite \
+    [--tests_dir <directory of .json/.yaml test files>] \
+    [--workers <number of browser processes>] \
+    [--junit_xml <output file>] \
+    [--shard_index <index> --shard_count <count>] \
+    [--slowest <number of steps to report>] \
+    [--headless]
+"""
+
+import json
+import multiprocessing
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from examples.qa import check_expected_results, group_test_steps
+from examples.utils import get_logger, get_workflow_kwargs
+
+from nova_act import NovaAct, workflow
+
+LOGGER = get_logger(__name__)
+
+TEST_FILE_SUFFIXES = {".json", ".yaml", ".yml"}
+
+
+def load_test_file(path: Path) -> dict:
+    """Load a test definition from a JSON or YAML file."""
+    if path.suffix == ".json":
+        return json.loads(path.read_text())
+    try:
+        import yaml  # type: ignore
+    except ImportError:
+        raise ImportError(f"PyYAML is required to load {path}: pip install pyyaml")
+    return yaml.safe_load(path.read_text())
+
+
+@workflow(**get_workflow_kwargs())
+def run_test_file(path: str, headless: bool = True) -> dict:
+    """Run every step in a test file, recording a result for each one instead of stopping at failures."""
+    test = load_test_file(Path(path))
+    steps = test["steps"]
+    results = {
+        i: {
+            "step": i,
+            "action": step.get("action"),
+            "expected_result": step.get("expected_result"),
+            "status": "error",
+            "message": "Step was not run",
+            "seconds": 0.0,
+        }
+        for i, step in enumerate(steps, 1)
+    }
+    action_steps = iter(i for i, step in enumerate(steps, 1) if step.get("action"))
+    started = time.monotonic()
+
+    try:
+        with NovaAct(starting_page=test["starting_page"], headless=headless) as nova:
+            for action, expectations in group_test_steps(steps):
+                if action:
+                    action_step = next(action_steps)
+                    action_started = time.monotonic()
+                    try:
+                        nova.act(action)
+                    except Exception as e:
+                        results[action_step]["message"] = f"Action failed: {e}"
+                        results[action_step]["seconds"] = time.monotonic() - action_started
+                        for i, _ in expectations:
+                            # A step with both an action and an expected result keeps the action's error
+                            if i != action_step:
+                                results[i]["message"] = f"Skipped because action '{action}' failed"
+                        continue
+                    results[action_step] |= {
+                        "status": "passed",
+                        "message": "",
+                        "seconds": time.monotonic() - action_started,
+                    }
+
+                if not expectations:
+                    continue
+
+                # Batched expectations share the latency of the single act_get() call
+                check_started = time.monotonic()
+                try:
+                    passed = check_expected_results(nova, expectations)
+                except Exception as e:
+                    for i, _ in expectations:
+                        results[i]["message"] = f"Check failed: {e}"
+                    continue
+                check_seconds = time.monotonic() - check_started
+
+                for i, expected_result in expectations:
+                    if results[i]["action"] and results[i]["status"] != "passed":
+                        continue
+                    results[i]["seconds"] += check_seconds
+                    results[i]["status"] = "passed" if passed[i] else "failed"
+                    results[i]["message"] = (
+                        "" if passed[i] else f"Expected result was not met: '{expected_result}'"
+                    )
+    except Exception as e:
+        LOGGER.error(f"Test file {path} stopped early: {e}")
+
+    return {
+        "name": test.get("name", Path(path).stem),
+        "file": path,
+        "seconds": time.monotonic() - started,
+        "steps": list(results.values()),
+    }
+
+
+def write_junit_xml(suites: list[dict], output_path: str) -> None:
+    """Write one <testsuite> per test file and one <testcase> per step."""
+    root = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0}
+    for suite in suites:
+        steps = suite["steps"]
+        counts = {
+            "tests": len(steps),
+            "failures": sum(1 for s in steps if s["status"] == "failed"),
+            "errors": sum(1 for s in steps if s["status"] == "error"),
+        }
+        suite_element = ET.SubElement(
+            root,
+            "testsuite",
+            name=suite["name"],
+            file=suite["file"],
+            time=f"{suite['seconds']:.3f}",
+            **{key: str(value) for key, value in counts.items()},
+        )
+        for step in steps:
+            case = ET.SubElement(
+                suite_element,
+                "testcase",
+                classname=suite["name"],
+                name=f"Step {step['step']}: {step['action'] or step['expected_result']}",
+                time=f"{step['seconds']:.3f}",
+            )
+            if step["status"] == "failed":
+                ET.SubElement(case, "failure", message=step["message"])
+            elif step["status"] == "error":
+                ET.SubElement(case, "error", message=step["message"])
+        for key in totals:
+            totals[key] += counts[key]
+
+    for key, value in totals.items():
+        root.set(key, str(value))
+    root.set("time", f"{sum(s['seconds'] for s in suites):.3f}")
+    ET.ElementTree(root).write(output_path, encoding="utf-8", xml_declaration=True)
+
+
+def main(
+    tests_dir: str = str(Path(__file__).parent / "qa_tests"),
+    workers: int = 4,
+    junit_xml: str = "qa-results.xml",
+    shard_index: int = 0,
+    shard_count: int = 1,
+    slowest: int = 10,
+    headless: bool = True,
+) -> None:
+    """Run a suite of QA test files in parallel.
+
+    Args:
+        tests_dir: Directory containing .json/.yaml/.yml test files
+        workers: Number of browser processes to run at once
+        junit_xml: Path of the JUnit XML report to write
+        shard_index: Index of this shard when splitting the suite across machines
+        shard_count: Total number of shards
+        slowest: Number of slowest steps to report
+        headless: Whether to run the browsers headless
+    """
+    test_files = sorted(
+        str(path) for path in Path(tests_dir).iterdir() if path.suffix in TEST_FILE_SUFFIXES
+    )
+    test_files = test_files[shard_index::shard_count]
+    LOGGER.info(f"Running {len(test_files)} test files on {workers} workers")
+
+    suites = []
+    # Each worker process drives its own browser; spawn avoids forking a process with live threads
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {executor.submit(run_test_file, path, headless): path for path in test_files}
+        for future in as_completed(futures):
+            try:
+                suite = future.result()
+            except Exception as e:
+                LOGGER.error(f"✗ {futures[future]} could not be run: {e}")
+                suite = {
+                    "name": Path(futures[future]).stem,
+                    "file": futures[future],
+                    "seconds": 0.0,
+                    "steps": [
+                        {
+                            "step": 1,
+                            "action": None,
+                            "expected_result": "Test file runs",
+                            "status": "error",
+                            "message": str(e),
+                            "seconds": 0.0,
+                        }
+                    ],
+                }
+            failed = [s["step"] for s in suite["steps"] if s["status"] != "passed"]
+            if failed:
+                LOGGER.error(f"✗ {suite['name']}: steps {failed} did not pass")
+            else:
+                LOGGER.info(f"✓ {suite['name']} passed in {suite['seconds']:.1f}s")
+            suites.append(suite)
+
+    write_junit_xml(suites, junit_xml)
+    LOGGER.info(f"✓ JUnit report written to {junit_xml}")
+
+    all_steps = [(suite["name"], step) for suite in suites for step in suite["steps"]]
+    report = "\n".join(
+        f"  {step['seconds']:7.2f}s  {name} / Step {step['step']}: "
+        f"{step['action'] or step['expected_result']}"
+        for name, step in sorted(all_steps, key=lambda item: item[1]["seconds"], reverse=True)[
+            :slowest
+        ]
+    )
+    LOGGER.info(f"\nSlowest steps:\n{report}\n")
+
+    if any(step["status"] != "passed" for _, step in all_steps):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    import fire  # type: ignore
+
+    fire.Fire(main)
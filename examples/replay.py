@@ -0,0 +1,341 @@
+"""Record and replay NovaAct calls offline.
+
+Wraps the NovaAct used by the examples and the cdk/* apps so their orchestration code can be
+benchmarked and profiled without the live service. Record mode runs a workflow normally and stores
+every browser launch, `go_to_url` and `act`/`act_get` request and response, including its latency, in a
+gzipped JSON lines file. Replay mode serves those responses back deterministically without a browser or
+network access, optionally sleeping for the recorded latency (scaled by `--latency_scale`).
+
+Calls are matched on (page URL, method, prompt, schema), where the page URL is the page the call ran
+on: the starting page for a browser launch, and the page after any earlier navigation or reset for
+everything else. Replay follows the navigation each recorded call made, so later calls see the same
+page URL they were recorded on. When a call is made more often than it was recorded, its recorded
+responses are served again in order.
+
+Usage:
+python -m examples.replay --mode record --recording <file.jsonl.gz> <example module> [example args]
+python -m examples.replay --mode replay --recording <file.jsonl.gz> [--latency_scale <factor>] <example module> [example args]
+python -m examples.replay --mode replay --recording <file.jsonl.gz> --handler cdk/lambda/app.py:handler --event '<json>'
+"""
+
+import argparse
+import atexit
+import gzip
+import hashlib
+import importlib.util
+import inspect
+import json
+import runpy
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import nova_act
+
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode when a call has no recorded response."""
+
+
+class Recording:
+    """Recorded calls, grouped by request key, stored as gzipped JSON lines."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: dict[str, list[dict]] = defaultdict(list)
+        self._served: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(page_url: str | None, method: str, prompt: str | None = None, schema: Any = None) -> str:
+        request = json.dumps([page_url, method, prompt, schema], sort_keys=True)
+        return hashlib.sha1(request.encode()).hexdigest()
+
+    def load(self) -> "Recording":
+        with gzip.open(self.path, "rt") as f:
+            for line in f:
+                entry = json.loads(line)
+                self._entries[entry["key"]].append(entry)
+        return self
+
+    def add(self, entry: dict) -> None:
+        with self._lock:
+            self._entries[entry["key"]].append(entry)
+
+    def next(self, key: str, description: str) -> dict:
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise ReplayMissError(f"No recorded response for {description}")
+            entry = entries[self._served[key] % len(entries)]
+            self._served[key] += 1
+            return entry
+
+    def save(self) -> None:
+        with self._lock, gzip.open(self.path, "wt") as f:
+            for entries in self._entries.values():
+                for entry in entries:
+                    f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+
+class ReplayResult:
+    """Stands in for the ActResult/ActGetResult returned by NovaAct."""
+
+    def __init__(self, response=None, parsed_response=None, valid_json=None, matches_schema=None):
+        self.response = response
+        self.parsed_response = parsed_response
+        self.valid_json = valid_json
+        self.matches_schema = matches_schema
+        self.metadata = None
+
+    def __str__(self) -> str:
+        return f"ReplayResult(response={self.response!r})"
+
+
+def _result_fields(result) -> dict:
+    fields = {}
+    for name in ("response", "parsed_response", "valid_json", "matches_schema"):
+        value = getattr(result, name, None)
+        try:
+            json.dumps(value)
+        except TypeError:
+            value = str(value)
+        fields[name] = value
+    return fields
+
+
+class _ReplayPage:
+    """Minimal stand-in for the Playwright page, enough for session health checks and resets."""
+
+    class _Context:
+        def __init__(self, page: "_ReplayPage"):
+            self.pages = [page]
+
+        def on(self, event: str, callback: Any) -> None:
+            pass
+
+        def clear_cookies(self) -> None:
+            pass
+
+        def new_cdp_session(self, page):
+            return _ReplayPage._CdpSession()
+
+    class _CdpSession:
+        def send(self, method: str, params: dict | None = None) -> dict:
+            return {}
+
+        def detach(self) -> None:
+            pass
+
+    def __init__(self, url: str | None):
+        self.url = url or "about:blank"
+        self.context = self._Context(self)
+        self._closed = False
+        self._navigation_callbacks: list = []
+
+    def on(self, event: str, callback: Any) -> None:
+        if event == "framenavigated":
+            self._navigation_callbacks.append(callback)
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def evaluate(self, expression: str, arg: Any = None) -> Any:
+        if expression.strip() == "1":
+            return 1
+        if "location.origin" in expression:
+            parts = urlsplit(self.url)
+            return f"{parts.scheme}://{parts.netloc}" if parts.netloc else "null"
+        return None
+
+    def goto(self, url: str, **kwargs) -> None:
+        self.url = url
+        # The page stands in for its own main frame, which has a `url` too
+        for callback in self._navigation_callbacks:
+            callback(self)
+
+
+class RecordingNovaAct(nova_act.NovaAct):
+    """NovaAct that records every browser launch, go_to_url and act/act_get call it makes."""
+
+    recording: Recording
+
+    def __init__(self, *args, starting_page: str | None = None, **kwargs):
+        super().__init__(*args, starting_page=starting_page, **kwargs)
+        self._recorded_starting_page = starting_page
+
+    def _record(
+        self, method: str, page_url: str | None, prompt: str | None, schema: Any, started: float, result=None
+    ) -> None:
+        self.recording.add(
+            {
+                "key": Recording.key(page_url, method, prompt, schema),
+                "method": method,
+                "page_url": page_url,
+                # Where the call left the page, so replay can follow the same navigation
+                "final_url": self.page.url,
+                "prompt": prompt,
+                "latency": time.monotonic() - started,
+                **(_result_fields(result) if result is not None else {}),
+            }
+        )
+
+    def start(self, *args, **kwargs):
+        started = time.monotonic()
+        result = super().start(*args, **kwargs)
+        self._record("start", self._recorded_starting_page, None, None, started)
+        return result
+
+    def go_to_url(self, url: str, *args, **kwargs):
+        page_url = self.page.url
+        started = time.monotonic()
+        result = super().go_to_url(url, *args, **kwargs)
+        self._record("go_to_url", page_url, url, None, started)
+        return result
+
+    def act(self, prompt: str, *args, **kwargs):
+        page_url = self.page.url
+        started = time.monotonic()
+        result = super().act(prompt, *args, **kwargs)
+        self._record("act", page_url, prompt, None, started, result)
+        return result
+
+    def act_get(self, prompt: str, *args, **kwargs):
+        page_url = self.page.url
+        started = time.monotonic()
+        result = super().act_get(prompt, *args, **kwargs)
+        self._record("act_get", page_url, prompt, kwargs.get("schema"), started, result)
+        return result
+
+
+class ReplayNovaAct:
+    """Offline NovaAct that serves recorded responses without a browser or network access."""
+
+    recording: Recording
+    latency_scale: float = 1.0
+
+    def __init__(self, starting_page: str | None = None, **kwargs):
+        self._starting_page = starting_page
+        self.page = _ReplayPage(starting_page)
+        self.started = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _serve(self, method: str, prompt: str | None = None, schema: Any = None) -> dict:
+        page_url = self._starting_page if method == "start" else self.page.url
+        entry = self.recording.next(
+            Recording.key(page_url, method, prompt, schema),
+            f"{method}({prompt!r}) on {page_url}",
+        )
+        if self.latency_scale:
+            time.sleep(entry["latency"] * self.latency_scale)
+        if entry.get("final_url") and entry["final_url"] != self.page.url:
+            self.page.goto(entry["final_url"])
+        return entry
+
+    def start(self) -> None:
+        try:
+            self._serve("start")
+        except ReplayMissError:
+            pass
+        self.started = True
+
+    def stop(self) -> None:
+        self.started = False
+
+    def go_to_url(self, url: str) -> None:
+        try:
+            self._serve("go_to_url", url)
+        except ReplayMissError:
+            self.page.goto(url)
+
+    def act(self, prompt: str, **kwargs) -> ReplayResult:
+        entry = self._serve("act", prompt)
+        return ReplayResult(entry.get("response"), entry.get("parsed_response"))
+
+    def act_get(self, prompt: str, schema: Any = None, **kwargs) -> ReplayResult:
+        entry = self._serve("act_get", prompt, schema)
+        return ReplayResult(
+            entry.get("response"),
+            entry.get("parsed_response"),
+            entry.get("valid_json"),
+            entry.get("matches_schema"),
+        )
+
+
+def _offline_workflow(**kwargs):
+    """Replay runs have no workflow run to report to, so @workflow becomes a no-op."""
+    return lambda func: func
+
+
+def install(mode: str, path: str, latency_scale: float = 1.0) -> Recording:
+    """
+    Replaces `nova_act.NovaAct` with the recording or replaying implementation.
+
+    Call this before importing the example or app to run, since they bind NovaAct at import time.
+    """
+    if mode == "record":
+        recording = Recording(path)
+        RecordingNovaAct.recording = recording
+        nova_act.NovaAct = RecordingNovaAct
+        atexit.register(recording.save)
+    elif mode == "replay":
+        recording = Recording(path).load()
+        ReplayNovaAct.recording = recording
+        ReplayNovaAct.latency_scale = latency_scale
+        nova_act.NovaAct = ReplayNovaAct
+        nova_act.workflow = _offline_workflow
+    else:
+        raise ValueError(f"mode must be 'record' or 'replay', got {mode!r}")
+    return recording
+
+
+def load_handler(spec: str):
+    """Loads `path/to/app.py:handler` from a cdk/* app directory."""
+    path, _, name = spec.partition(":")
+    # The app may import modules that sit next to it, as it would in its container
+    app_dir = str(Path(path).resolve().parent)
+    if app_dir not in sys.path:
+        sys.path.insert(0, app_dir)
+    module_spec = importlib.util.spec_from_file_location(f"_replay_{hash(path) & 0xFFFF:x}", path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return getattr(module, name or "handler")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mode", choices=["record", "replay"], required=True)
+    parser.add_argument("--recording", required=True, help="Recording file (.jsonl.gz)")
+    parser.add_argument("--latency_scale", type=float, default=1.0, help="Multiplier for replayed latency, 0 to disable")
+    parser.add_argument("--handler", help="Run a cdk/* handler instead of an example, e.g. cdk/lambda/app.py:handler")
+    parser.add_argument("--event", default="{}", help="JSON event passed to --handler")
+    parser.add_argument("module", nargs="?", help="Example module to run, e.g. examples.qa")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the example")
+    options = parser.parse_args()
+
+    install(options.mode, options.recording, options.latency_scale)
+
+    if options.handler:
+        handler = load_handler(options.handler)
+        event = json.loads(options.event)
+        takes_context = len(inspect.signature(handler).parameters) > 1
+        print(json.dumps(handler(event, None) if takes_context else handler(event), default=str))
+    elif options.module:
+        sys.argv = [options.module, *options.args]
+        runpy.run_module(options.module, run_name="__main__", alter_sys=True)
+    else:
+        parser.error("either a module or --handler is required")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,9 @@ Shows how to use Nova Act to search for apartments on your favorite real estate
 and calculate commute times to transit stations on your favorite maps website.
 
 The apartment search occurs synchronously in headed mode and the commute calculation occurs 
-asynchronously in headless mode to show how to use Nova Act concurrently in a Thread Pool.
+asynchronously in headless mode to show how to use Nova Act concurrently on a pool of warm,
+reusable browser sessions. With --pipeline, each page of listings is handed to the commute
+sessions as soon as it is extracted, so lookups overlap with scrolling.
 
 Usage:
 python -m examples.search_aparments_calculate_commute \
@@ -14,17 +16,32 @@ python -m examples.search_aparments_calculate_commute \
     [--transit_city <city_with_a_transit_station>] \
     [--bedrooms <number_of_bedrooms>] \
     [--baths <number_of_baths>] \
+    [--pool_size <max_number_of_commute_sessions>] \
+    [--max_session_uses <lookups_before_recycling_a_session>] \
+    [--commute_cache_path <sqlite_file, empty to disable>] \
+    [--pipeline] \
     [--headless]
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import as_completed
+from pathlib import Path
 from typing import Literal, get_args
 
-import fire  # type: ignore
-import pandas as pd
 from pydantic import BaseModel
 
-from examples.utils import get_logger, get_workflow_kwargs
+from examples.utils import (
+    ConcurrencyController,
+    NovaActSessionPool,
+    get_logger,
+    get_schema,
+    get_workflow_kwargs,
+    validate_response,
+    validate_responses,
+)
 
 from nova_act import NovaAct, workflow
 
@@ -33,6 +50,13 @@ LOGGER = get_logger(__name__)
 TransportMode = Literal["walking", "biking"]
 TRANSPORT_MODES = list(get_args(TransportMode))
 
+# Kept in the user's cache directory so runs from any directory share it and don't leave files behind
+DEFAULT_COMMUTE_CACHE_PATH = str(
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "nova-act-examples"
+    / "commute_cache.sqlite3"
+)
+
 
 class Apartment(BaseModel):
     address: str
@@ -51,25 +75,129 @@ class TransitCommute(BaseModel):
     commute_distance_miles: float
 
 
+def normalize_address(address: str) -> str:
+    """Normalize an address so that formatting differences between listings map to the same key."""
+    return " ".join(re.sub(r"[^\w\s]", " ", address.lower()).split())
+
+
+class CommuteCache:
+    """Persistent SQLite cache of commute lookups.
+
+    Entries are keyed by the normalized (address, transit city, transport mode), expire after
+    `ttl_seconds`, and the least recently used entries are evicted beyond `max_entries`.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS commutes ("
+            "key TEXT PRIMARY KEY, commute TEXT NOT NULL, "
+            "created_at REAL NOT NULL, last_used_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS commutes_last_used ON commutes (last_used_at)"
+        )
+        self._db.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def key(address: str, transit_city: str, transport_mode: TransportMode) -> str:
+        return "|".join(
+            [normalize_address(address), normalize_address(transit_city), transport_mode]
+        )
+
+    def get_many(
+        self, addresses: list[str], transit_city: str, transport_mode: TransportMode
+    ) -> list[TransitCommute | None]:
+        """Looks up several addresses in one query, with None for each address not cached."""
+        keys = [self.key(address, transit_city, transport_mode) for address in addresses]
+        now = time.time()
+        rows = self._db.execute(
+            "SELECT key, commute, created_at FROM commutes "
+            f"WHERE key IN ({', '.join('?' * len(keys))})",
+            keys,
+        ).fetchall()
+        fresh = {
+            key: commute
+            for key, commute, created_at in rows
+            if now - created_at <= self.ttl_seconds
+        }
+        expired = [(key,) for key, _, _ in rows if key not in fresh]
+
+        self._db.executemany("DELETE FROM commutes WHERE key = ?", expired)
+        self._db.executemany(
+            "UPDATE commutes SET last_used_at = ? WHERE key = ?",
+            [(now, key) for key in fresh],
+        )
+        self._db.commit()
+        # Cached commutes are stored as JSON, so the whole batch is parsed and validated at once
+        commutes = dict(
+            zip(fresh, validate_responses(TransitCommute, list(fresh.values())))
+        )
+        self.hits += sum(1 for key in keys if key in commutes)
+        self.misses += sum(1 for key in keys if key not in commutes)
+        return [commutes.get(key) for key in keys]
+
+    def put(
+        self,
+        address: str,
+        transit_city: str,
+        transport_mode: TransportMode,
+        commute: TransitCommute,
+    ) -> None:
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO commutes VALUES (?, ?, ?, ?)",
+            (
+                self.key(address, transit_city, transport_mode),
+                commute.model_dump_json(),
+                now,
+                now,
+            ),
+        )
+        self._db.execute(
+            "DELETE FROM commutes WHERE key NOT IN "
+            "(SELECT key FROM commutes ORDER BY last_used_at DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+        self._db.commit()
+
+    def stats(self) -> str:
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups if lookups else 0.0
+        return f"{self.hits} hits, {self.misses} misses ({hit_rate:.0%} hit rate)"
+
+    def close(self) -> None:
+        self._db.close()
+
+
 def add_commute_distance(
+    nova: NovaAct,
     apartment: Apartment,
     transit_city: str,
     transport_mode: TransportMode,
-    maps_url: str,
 ) -> TransitCommute | None:
-    with NovaAct(
-        starting_page=maps_url,
-        headless=True,
-    ) as nova:
-        result = nova.act_get(
-            f"Search for {transit_city} transit station and press enter. "
-            "Click Directions. "
-            f"Enter '{apartment.address}' into the starting point field and press enter. "
-            f"Return the shortest {transport_mode} time and distance.",
-            schema=TransitCommute.model_json_schema(),
-        )
-        time_distance = TransitCommute.model_validate(result.parsed_response)
-        return time_distance
+    """Look up the commute on a pooled session that has already been reset to the maps page."""
+    result = nova.act_get(
+        f"Search for {transit_city} transit station and press enter. "
+        "Click Directions. "
+        f"Enter '{apartment.address}' into the starting point field and press enter. "
+        f"Return the shortest {transport_mode} time and distance.",
+        schema=get_schema(TransitCommute),
+    )
+    time_distance = validate_response(TransitCommute, result.parsed_response)
+    return time_distance
 
 
 @workflow(**get_workflow_kwargs())
@@ -82,6 +210,13 @@ def main(
     baths: int = 1,
     headless: bool = False,
     min_apartments_to_find: int = 5,
+    pool_size: int | None = None,
+    max_session_uses: int = 20,
+    commute_cache_path: str = DEFAULT_COMMUTE_CACHE_PATH,
+    commute_cache_ttl_hours: float = 24 * 7,
+    commute_cache_max_entries: int = 10_000,
+    pipeline: bool = False,
+    max_pending_lookups: int = 50,
 ) -> None:
     """Find apartments and calculate distance to transit station.
 
@@ -93,60 +228,119 @@ def main(
         [--transport_mode <walking|biking>] \
         [--bedrooms <number_of_bedrooms>] \
         [--baths <number_of_baths>] \
+        [--pool_size <max_number_of_commute_sessions>] \
+        [--max_session_uses <lookups_before_recycling_a_session>] \
+        [--commute_cache_path <sqlite_file, empty to disable>] \
+        [--pipeline] \
         [--headless]
     """
     if transport_mode not in TRANSPORT_MODES:
         raise ValueError(f"transport_mode must be one of {TRANSPORT_MODES}")
 
     all_apartments: list[Apartment] = []
+    seen_addresses: set[str] = set()
+    apartments_commutable = []
+    future_to_apartment = {}
 
-    with NovaAct(
-        starting_page=apartment_url,
-        headless=headless,
-    ) as nova:
-
-        nova.act(
-            "Close any cookie banners. "
-            f"Search for apartments near {transit_city}, "
-            f"then filter for {bedrooms} bedrooms and {baths} bathrooms. "
-            "Close any dialogs that get in the way of your task. "
-            "Ensure the results mode is set to List."
-        )
-
-        for _ in range(5):  # Scroll down a max of 5 times.
-            result = nova.act_get(
-                "Return the currently visible list of apartments",
-                schema=ApartmentList.model_json_schema(),
-            )
-            apartment_list = ApartmentList.model_validate(result.parsed_response)
-            all_apartments.extend(apartment_list.apartments)
-            if len(all_apartments) >= min_apartments_to_find:
-                break
-            nova.act("Scroll down once")
-
-        LOGGER.info(f"✓ Found apartments: {all_apartments}")
+    # Concurrency is sized from free memory rather than CPU count, since each session is a browser.
+    controller = ConcurrencyController(max_workers=pool_size)
+    # Sessions stay warm between lookups, so each browser is launched once rather than per apartment.
+    # They are only launched when the first lookup reaches them.
+    pool = NovaActSessionPool(
+        size=controller.initial_workers(),
+        starting_page=maps_url,
+        max_uses=max_session_uses,
+        max_pending=max_pending_lookups,
+        headless=True,
+    )
 
-    apartments_commutable = []
-    with ThreadPoolExecutor() as executor:
-        future_to_apartment = {
-            executor.submit(
+    def submit_commute_lookups(apartments: list[Apartment]) -> None:
+        cached_commutes = commute_cache.get_many(
+            [apartment.address for apartment in apartments], transit_city, transport_mode
+        )
+        for apartment, cached_commute in zip(apartments, cached_commutes):
+            if cached_commute is not None:
+                apartments_commutable.append(
+                    apartment.model_dump() | cached_commute.model_dump()
+                )
+                continue
+            future = pool.submit(
                 add_commute_distance,
                 apartment,
                 transit_city,
                 transport_mode,
-                maps_url,
-            ): apartment
-            for apartment in all_apartments
-        }
-        for future in as_completed(future_to_apartment.keys()):
-            apartment = future_to_apartment[future]
-            commute_details = future.result()
-            if commute_details is not None:
-                apartments_commutable.append(
-                    apartment.model_dump() | commute_details.model_dump()
+            )
+            future_to_apartment[future] = apartment
+
+    # Repeat runs skip the browser entirely for addresses whose commute is already known.
+    with CommuteCache(
+        path=commute_cache_path or ":memory:",
+        ttl_seconds=commute_cache_ttl_hours * 3600,
+        max_entries=commute_cache_max_entries,
+    ) as commute_cache:
+        with pool:
+            with NovaAct(
+                starting_page=apartment_url,
+                headless=headless,
+            ) as nova:
+
+                nova.act(
+                    "Close any cookie banners. "
+                    f"Search for apartments near {transit_city}, "
+                    f"then filter for {bedrooms} bedrooms and {baths} bathrooms. "
+                    "Close any dialogs that get in the way of your task. "
+                    "Ensure the results mode is set to List."
                 )
-            else:
-                apartments_commutable.append(apartment.model_dump())
+
+                for _ in range(5):  # Scroll down a max of 5 times.
+                    result = nova.act_get(
+                        "Return the currently visible list of apartments",
+                        schema=get_schema(ApartmentList),
+                    )
+                    apartment_list = validate_response(ApartmentList, result.parsed_response)
+                    # Consecutive scroll positions overlap, so keep only listings not seen yet.
+                    new_apartments = []
+                    for apartment in apartment_list.apartments:
+                        address_key = normalize_address(apartment.address)
+                        if address_key not in seen_addresses:
+                            seen_addresses.add(address_key)
+                            new_apartments.append(apartment)
+                    all_apartments.extend(new_apartments)
+                    if pipeline:
+                        # Headless lookups start while the headed session keeps scrolling.
+                        submit_commute_lookups(new_apartments)
+                    if len(all_apartments) >= min_apartments_to_find:
+                        break
+                    if not new_apartments:
+                        LOGGER.info("Scrolling found no new apartments, stopping the search")
+                        break
+                    nova.act("Scroll down once")
+
+                LOGGER.info(f"✓ Found apartments: {all_apartments}")
+
+            if not pipeline:
+                submit_commute_lookups(all_apartments)
+
+            for future in as_completed(future_to_apartment.keys()):
+                apartment = future_to_apartment[future]
+                controller.adjust(pool)
+                commute_details = future.result()
+                if commute_details is not None:
+                    commute_cache.put(
+                        apartment.address, transit_city, transport_mode, commute_details
+                    )
+                    apartments_commutable.append(
+                        apartment.model_dump() | commute_details.model_dump()
+                    )
+                else:
+                    apartments_commutable.append(apartment.model_dump())
+
+        LOGGER.info(f"Commute cache: {commute_cache.stats()}")
+
+    controller.report()
+
+    # Only needed for the final table, so its import doesn't slow down startup
+    import pandas as pd
 
     apartments_df = pd.DataFrame(apartments_commutable)
     closest_apartment_data = apartments_df.sort_values(
@@ -158,4 +352,6 @@ def main(
 
 
 if __name__ == "__main__":
+    import fire  # type: ignore
+
     fire.Fire(main)
@@ -3,14 +3,19 @@
 Set up a user_data_dir for your browser data and configure Nova Act with it.
 See the SDK README for more details.
 
+Parallel sessions can't share one user_data_dir. To run several sessions with this profile, use
+`ChromeProfilePool` from examples/utils.py, which keeps copy-on-write clones of it ready to hand out:
+
+    with ChromeProfilePool(user_data_dir, size=4) as profiles:
+        with NovaActSessionPool(size=4, starting_page=url, profile_pool=profiles) as pool:
+            ...
+
 Usage:
 python -m examples.setup_chrome_user_data_dir --user_data_dir <directory>
 """
 
 import os
 
-import fire  # type: ignore
-
 from examples.utils import get_logger, get_workflow_kwargs
 
 from nova_act import NovaAct, workflow
@@ -33,4 +38,6 @@ def main(url: str, user_data_dir: str) -> None:
 
 
 if __name__ == "__main__":
+    import fire  # type: ignore
+
     fire.Fire(main)
@@ -9,6 +9,7 @@ python -m examples.tool_use.basic.get_current_date
 from datetime import datetime
 from pathlib import Path
 
+from examples.tracing import traced
 from examples.utils import get_logger, get_workflow_kwargs
 
 from nova_act import NovaAct, SecurityOptions, tool, workflow
@@ -17,6 +18,7 @@ LOGGER = get_logger(__name__)
 
 
 @tool
+@traced
 def get_current_date():
     """Gets the current date in MM/DD/YYYY format."""
     return datetime.now().strftime("%m/%d/%Y")
@@ -4,22 +4,117 @@ See the README for more details.
 
 Usage:
 python -m examples.tool_use.excel.form_fill [--file_name <excel_file>] [--row_number <row>]
+python -m examples.tool_use.excel.form_fill --bulk [--file_name <excel_file>] [--workers <sessions>] [--output <results.jsonl>]
 """
 
+import functools
+import json
+import os
+import tempfile
+import threading
 from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import url2pathname
 
-import fire  # type: ignore
-import pandas as pd
 from pydantic import BaseModel
 
-from examples.utils import get_logger, get_workflow_kwargs
+from examples.tracing import traced
+from examples.utils import (
+    FormFieldFiller,
+    NovaActSessionPool,
+    get_logger,
+    get_schema,
+    get_workflow_kwargs,
+    validate_response,
+)
 
 from nova_act import NovaAct, SecurityOptions, workflow, tool
 
 LOGGER = get_logger(__name__)
 
 
+# Workbooks with at least this many rows get a memory-mapped columnar sidecar file
+SIDECAR_MIN_ROWS = 10_000
+
+
+class WorkbookRows:
+    """Row access for one version of a workbook, backed by a DataFrame or a memory-mapped Arrow table."""
+
+    def __init__(self, frame):
+        self._frame = frame
+        self._is_arrow = hasattr(frame, "num_rows")
+
+    def __len__(self):
+        return self._frame.num_rows if self._is_arrow else len(self._frame)
+
+    def row(self, index):
+        if not self._is_arrow:
+            return self._frame.iloc[index].to_dict()
+        # Slicing a memory-mapped table only touches the pages holding this row
+        return self._frame.slice(index, 1).to_pylist()[0]
+
+
+@functools.lru_cache(maxsize=8)
+def load_workbook_rows(file_path, mtime_ns, size):
+    """
+    Parses a workbook once per (path, mtime, size) so repeated tool calls don't re-read the XML.
+
+    Large workbooks are also written to an uncompressed Feather sidecar next to the workbook. Later
+    processes memory-map the sidecar instead of parsing the workbook at all, and a row lookup is a
+    direct offset into the columns. Requires pyarrow; without it the parsed sheet is only cached in
+    memory.
+    """
+    path = Path(file_path)
+    sidecar = path.with_name(f".{path.name}.{mtime_ns}-{size}.feather")
+    try:
+        from pyarrow import feather
+    except ImportError:
+        feather = None
+
+    if feather is not None and sidecar.exists():
+        return WorkbookRows(feather.read_table(sidecar, memory_map=True))
+
+    # pandas is only imported when a workbook has to be parsed, not when a sidecar exists
+    import pandas as pd
+
+    # Read the Excel file using pandas with openpyxl engine
+    df = pd.read_excel(file_path, engine="openpyxl")
+    if feather is None or len(df) < SIDECAR_MIN_ROWS:
+        return WorkbookRows(df)
+
+    try:
+        # Remove sidecars for older versions of this workbook, not one another process just wrote
+        for stale in path.parent.glob(f".{path.name}.*.feather"):
+            if stale != sidecar:
+                stale.unlink(missing_ok=True)
+        df.columns = [str(column) for column in df.columns]
+        # Write to a temp file and rename it into place, so no process maps a half-written sidecar
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            df.reset_index(drop=True).to_feather(temp_name, compression="uncompressed")
+            os.replace(temp_name, sidecar)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+    except Exception as e:
+        LOGGER.warning(f"Could not write sidecar for {file_path}, keeping it in memory: {e}")
+        return WorkbookRows(df)
+    return WorkbookRows(feather.read_table(sidecar, memory_map=True))
+
+
+def get_workbook_rows(file_path):
+    # The model passes the file:// URI from the prompt, so convert it to a local path
+    file_path = str(file_path)
+    parsed = urlparse(file_path)
+    if parsed.scheme == "file":
+        file_path = url2pathname(parsed.path)
+    stat = Path(file_path).stat()
+    return load_workbook_rows(file_path, stat.st_mtime_ns, stat.st_size)
+
+
 @tool
+@traced
 def read_row_as_dict(file_path, row_number):
     """
     Reads a specific row from an Excel file and returns it as a dictionary where
@@ -32,17 +127,17 @@ def read_row_as_dict(file_path, row_number):
     Returns:
         dict: A dictionary containing the data from the specified row.
     """
-    # Read the Excel file using pandas with openpyxl engine
-    df = pd.read_excel(file_path, engine="openpyxl")
+    # Reuse the parsed sheet until the file changes
+    rows = get_workbook_rows(file_path)
 
     # Check if the row_number is within the valid range
-    if row_number < 1 or row_number > len(df):
+    if row_number < 1 or row_number > len(rows):
         raise ValueError(
-            f"Row number {row_number} is out of range. The sheet has {len(df)} rows."
+            f"Row number {row_number} is out of range. The sheet has {len(rows)} rows."
         )
 
     # Get the row data as a dictionary
-    row_data = df.iloc[row_number - 1].to_dict()
+    row_data = rows.row(row_number - 1)
 
     return row_data
 
@@ -59,40 +154,159 @@ class PersonList(BaseModel):
     people: list[Person]
 
 
+# Selectors for contact_order_form.html, filled directly rather than typed by the model
+CONTACT_FORM_FILLER = FormFieldFiller(
+    {
+        "first_name": "#firstName",
+        "last_name": "#lastName",
+        "email": "#email",
+        "phone": "#phone",
+        "address": "#address",
+    }
+)
+
+
 # Get the directory where our data files are stored
 script_dir = Path(__file__).parent
 data_files_dir = script_dir / "data_files"
 
 
+def build_prompt(file_uri, row_number):
+    return f"""
+    Read the data from row number {row_number} in the Excel file {file_uri} in the current folder.
+    Enter this data into the appropriate fields of the web form on the page using the
+    fill_known_fields tool, enter any fields it could not fill yourself, and then submit the form.
+
+    Return the data that you read from the Excel file.
+    """
+
+
+def fill_row(nova, file_uri, row_number):
+    """Fill and submit the form for one row on a pooled session."""
+    CONTACT_FORM_FILLER.bind(nova)
+    result = nova.act_get(build_prompt(file_uri, row_number), schema=get_schema(Person))
+    return validate_response(Person, result.parsed_response)
+
+
+def read_completed_rows(output_path):
+    """Rows that already have a result in the output file, so a rerun can resume after them."""
+    if not output_path.exists():
+        return set()
+    completed = set()
+    skipped = 0
+    with output_path.open() as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A run that crashed mid-write leaves a truncated last line
+                skipped += 1
+                continue
+            if isinstance(record, dict) and "person" in record:
+                completed.add(record["row"])
+    if skipped:
+        LOGGER.warning(f"Skipped {skipped} malformed line(s) in {output_path}")
+    return completed
+
+
+def fill_all_rows(file_path, output_path, workers, headless):
+    """
+    Fills the form once per spreadsheet row across a pool of NovaAct sessions.
+
+    Each result is appended to `output_path` as a JSON line as soon as it completes. The output file
+    doubles as the checkpoint: rows that already have a result are skipped when the run is repeated.
+    """
+    total_rows = len(get_workbook_rows(file_path))
+    completed_rows = read_completed_rows(output_path)
+    LOGGER.info(
+        f"Filling {total_rows - len(completed_rows)} of {total_rows} rows "
+        f"({len(completed_rows)} already completed) with {workers} sessions"
+    )
+
+    file_uri = file_path.absolute().as_uri()
+    write_lock = threading.Lock()
+    counts = {"succeeded": 0, "failed": 0}
+
+    with output_path.open("a") as output:
+
+        def write_result(row_number, future):
+            if future.exception() is None:
+                record = {"row": row_number, "person": future.result().model_dump()}
+                outcome = "succeeded"
+            else:
+                record = {"row": row_number, "error": str(future.exception())}
+                outcome = "failed"
+            with write_lock:
+                output.write(json.dumps(record) + "\n")
+                output.flush()
+                counts[outcome] += 1
+
+        # The bounded queue keeps only a few rows in flight, however large the workbook is
+        with NovaActSessionPool(
+            size=workers,
+            starting_page=f"file://{data_files_dir.absolute() / 'contact_order_form.html'}",
+            max_pending=workers * 2,
+            security_options=SecurityOptions(allow_file_urls=True),
+            ignore_https_errors=True,
+            tools=[read_row_as_dict, CONTACT_FORM_FILLER.tool],
+            headless=headless,
+        ) as pool:
+            for row_number in range(1, total_rows + 1):
+                if row_number in completed_rows:
+                    continue
+                future = pool.submit(fill_row, file_uri, row_number)
+                future.add_done_callback(functools.partial(write_result, row_number))
+
+    LOGGER.info(
+        f"✓ Bulk fill completed: {counts['succeeded']} succeeded, {counts['failed']} failed. "
+        f"Results written to {output_path}"
+    )
+
+
 @workflow(**get_workflow_kwargs())
-def main(file_name: str = "people.xlsx", row_number: int = 1):
+def main(
+    file_name: str = "people.xlsx",
+    row_number: int = 1,
+    bulk: bool = False,
+    workers: int = 4,
+    output: str | None = None,
+    headless: bool = True,
+):
     """Extract data from Excel files and populate a form.
 
     Args:
         file_name: Excel file name (default: people.xlsx)
         row_number: Row number to read (1-3, default: 1)
+        bulk: Fill the form once for every row in the file instead of a single row
+        workers: Number of browser sessions to use in bulk mode (default: 4)
+        output: JSON lines file for bulk results, which is also used to resume (default: <file>.results.jsonl)
+        headless: Run the bulk mode browsers headless (default: True)
     """
+    if bulk:
+        file_path = data_files_dir / file_name
+        output_path = Path(output) if output else Path(f"{file_path.stem}.results.jsonl")
+        fill_all_rows(file_path, output_path, workers, headless)
+        return
+
     if row_number not in [1, 2, 3]:
         row_number = 1
 
     file_uri = (data_files_dir / file_name).absolute().as_uri()
 
-    prompt = f"""
-    Read the data from row number {row_number} in the Excel file {file_uri} in the current folder.
-    Enter this data into the appropriate fields of the web form on the page, and then submit the form.
-
-    Return the data that you read from the Excel file.
-    """
+    prompt = build_prompt(file_uri, row_number)
     with NovaAct(
         starting_page=f"file://{data_files_dir.absolute() / 'contact_order_form.html'}",
         security_options=SecurityOptions(allow_file_urls=True),
         ignore_https_errors=True,
-        tools=[read_row_as_dict],
+        tools=[read_row_as_dict, CONTACT_FORM_FILLER.tool],
     ) as nova:
-        result = nova.act_get(prompt, schema=Person.model_json_schema())
-        person_data = Person.model_validate(result.parsed_response)
+        CONTACT_FORM_FILLER.bind(nova)
+        result = nova.act_get(prompt, schema=get_schema(Person))
+        person_data = validate_response(Person, result.parsed_response)
         LOGGER.info(f"✓ Task completed: \n{person_data}")
 
 
 if __name__ == "__main__":
+    import fire  # type: ignore
+
     fire.Fire(main)
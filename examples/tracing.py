@@ -0,0 +1,407 @@
+"""Timing spans and latency histograms for NovaAct workflows.
+
+Records nested spans for each `@workflow` run, browser launch (`start`), `act`/`act_get` call and
+`@traced` tool call. Spans are exported as OpenTelemetry (OTLP/JSON) trace data to a local file,
+one export request per line, and/or to an OTLP/HTTP collector. Latencies are also aggregated into
+per-span-name histograms in-process and summarized when the process exits.
+
+Examples enable it through `get_workflow_kwargs()` when one of these is set:
+NOVA_ACT_TRACE_PATH      File to append OTLP/JSON trace data to
+NOVA_ACT_TRACE_ENDPOINT  OTLP/HTTP collector base URL, e.g. http://localhost:4318
+
+Usage:
+python -m examples.tracing [--trace_path <file.jsonl>] [--trace_endpoint <url>] <example module> [example args]
+python -m examples.tracing [--trace_path <file.jsonl>] --handler cdk/lambda/app.py:handler --event '<json>'
+"""
+
+import argparse
+import atexit
+import bisect
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import runpy
+import secrets
+import sys
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from typing import Any
+
+import nova_act
+
+LOGGER = logging.getLogger(__name__)
+
+SERVICE_NAME = "nova-act-samples"
+# Upper bounds in milliseconds, from quick page reads to long multi-step acts
+HISTOGRAM_BOUNDS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000, 300000)
+MAX_ATTRIBUTE_LENGTH = 512
+EXPORT_INTERVAL_SECONDS = 5
+EXPORT_BATCH_SIZE = 256
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_current_span: contextvars.ContextVar["Span | None"] = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """A timed operation, parented to the span that was current when it started."""
+
+    def __init__(self, name: str, kind: int, attributes: dict[str, Any], parent: "Span | None"):
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent.span_id if parent else None
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.error: str | None = None
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    def to_otlp(self) -> dict:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": STATUS_ERROR, "message": self.error} if self.error else {"code": STATUS_OK},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict]:
+    encoded = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            encoded_value = {"boolValue": value}
+        elif isinstance(value, int):
+            encoded_value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            encoded_value = {"doubleValue": value}
+        else:
+            encoded_value = {"stringValue": _truncate(value)}
+        encoded.append({"key": key, "value": encoded_value})
+    return encoded
+
+
+def _truncate(value: Any) -> str:
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    return text if len(text) <= MAX_ATTRIBUTE_LENGTH else text[:MAX_ATTRIBUTE_LENGTH] + "..."
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram, cheap enough to update on every span."""
+
+    def __init__(self, bounds_ms: tuple[float, ...] = HISTOGRAM_BOUNDS_MS):
+        self.bounds_ms = bounds_ms
+        self.bucket_counts = [0] * (len(bounds_ms) + 1)
+        self.count = 0
+        self.errors = 0
+        self.sum_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+
+    def record(self, duration_ms: float, error: bool = False) -> None:
+        self.bucket_counts[bisect.bisect_left(self.bounds_ms, duration_ms)] += 1
+        self.count += 1
+        self.errors += error
+        self.sum_ms += duration_ms
+        self.min_ms = min(self.min_ms, duration_ms)
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def percentile(self, p: float) -> float:
+        """Estimates the p-th percentile by interpolating within its bucket."""
+        rank = p / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds_ms[i - 1] if i > 0 else self.min_ms
+                upper = self.bounds_ms[i] if i < len(self.bounds_ms) else self.max_ms
+                lower, upper = max(lower, self.min_ms), min(upper, self.max_ms)
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.max_ms
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.sum_ms / self.count, 1) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 1),
+            "p95_ms": round(self.percentile(95), 1),
+            "p99_ms": round(self.percentile(99), 1),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class Tracer:
+    """Creates spans, aggregates their latencies and exports them in the background."""
+
+    def __init__(self, trace_path: str | None = None, trace_endpoint: str | None = None):
+        self.trace_path = trace_path
+        self.trace_endpoint = trace_endpoint.rstrip("/") + "/v1/traces" if trace_endpoint else None
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._pending: list[Span] = []
+        self._lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        if self.trace_path or self.trace_endpoint:
+            threading.Thread(target=self._export_loop, daemon=True).start()
+
+    @contextmanager
+    def span(self, name: str, kind: int = SPAN_KIND_INTERNAL, **attributes):
+        """Times the enclosed block as a child of the current span."""
+        span = Span(name, kind, attributes, _current_span.get())
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            self._finish(span)
+
+    def _finish(self, span: Span) -> None:
+        span.end_ns = time.time_ns()
+        with self._lock:
+            histogram = self._histograms.setdefault(span.name, LatencyHistogram())
+            histogram.record(span.duration_ms, span.error is not None)
+            if self.trace_path or self.trace_endpoint:
+                self._pending.append(span)
+                if len(self._pending) >= EXPORT_BATCH_SIZE:
+                    self._flush_requested.set()
+
+    def histograms(self) -> dict[str, dict]:
+        """Latency summary per span name."""
+        with self._lock:
+            return {name: histogram.summary() for name, histogram in self._histograms.items()}
+
+    def log_summary(self) -> None:
+        summaries = self.histograms()
+        if not summaries:
+            return
+        lines = [f"{'span':<24}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+        for name, s in sorted(summaries.items()):
+            lines.append(
+                f"{name:<24}{s['count']:>7}{s['errors']:>8}{s['p50_ms']:>10}{s['p95_ms']:>10}{s['p99_ms']:>10}{s['max_ms']:>10}"
+            )
+        LOGGER.info("Span latencies:\n" + "\n".join(lines))
+
+    def _export_loop(self) -> None:
+        while True:
+            self._flush_requested.wait(EXPORT_INTERVAL_SECONDS)
+            self._flush_requested.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Exports pending spans as one OTLP/JSON ExportTraceServiceRequest."""
+        with self._lock:
+            spans, self._pending = self._pending, []
+        if not spans:
+            return
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _otlp_attributes({"service.name": SERVICE_NAME})},
+                    "scopeSpans": [
+                        {"scope": {"name": __name__}, "spans": [span.to_otlp() for span in spans]}
+                    ],
+                }
+            ]
+        }
+        body = json.dumps(request, separators=(",", ":"))
+        # Export failures are logged rather than raised, so tracing never breaks a workflow
+        if self.trace_path:
+            try:
+                with open(self.trace_path, "a") as f:
+                    f.write(body + "\n")
+            except OSError as e:
+                LOGGER.warning(f"Could not write spans to {self.trace_path}: {e}")
+        if self.trace_endpoint:
+            try:
+                http_request = urllib.request.Request(
+                    self.trace_endpoint, data=body.encode(), headers={"Content-Type": "application/json"}
+                )
+                urllib.request.urlopen(http_request, timeout=10).close()
+            except OSError as e:
+                LOGGER.warning(f"Could not export spans to {self.trace_endpoint}: {e}")
+
+    def shutdown(self) -> None:
+        self.flush()
+        self.log_summary()
+
+
+_tracer: Tracer | None = None
+_install_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer | None:
+    """The installed tracer, or None when tracing is not enabled."""
+    return _tracer
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Times the enclosed block as a custom span. Does nothing when tracing is not enabled."""
+    if _tracer is None:
+        yield None
+    else:
+        with _tracer.span(name, **attributes) as current:
+            yield current
+
+
+def traced(func=None, *, name: str | None = None):
+    """
+    Records a span for each call of `func`. Apply it below `@tool` so tool calls appear under the
+    act that made them:
+
+        @tool
+        @traced
+        def read_row_as_dict(file_path, row_number): ...
+    """
+    if func is None:
+        return functools.partial(traced, name=name)
+    span_name = name or f"tool.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _tracer is None:
+            return func(*args, **kwargs)
+        with _tracer.span(span_name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _wrap_method(cls, method_name: str, span_name: str, kind: int, describe=None) -> None:
+    original = getattr(cls, method_name, None)
+    if original is None or getattr(original, "_traced", False):
+        return
+
+    @functools.wraps(original)
+    def wrapper(self, *args, **kwargs):
+        attributes = describe(self, *args, **kwargs) if describe else {}
+        with _tracer.span(span_name, kind, **attributes):
+            return original(self, *args, **kwargs)
+
+    wrapper._traced = True
+    setattr(cls, method_name, wrapper)
+
+
+def _describe_act(nova, prompt, *args, **kwargs) -> dict:
+    attributes = {"nova_act.prompt": prompt}
+    if kwargs.get("schema") is not None:
+        attributes["nova_act.schema"] = kwargs["schema"]
+    return attributes
+
+
+def _describe_start(nova, *args, **kwargs) -> dict:
+    page = getattr(nova, "_starting_page", None) or getattr(nova, "starting_page", None)
+    return {"nova_act.starting_page": page} if isinstance(page, str) else {}
+
+
+def _wrap_workflow(workflow_cls) -> None:
+    """Each `@workflow` run becomes a root span that its acts are nested under."""
+    enter, exit_ = workflow_cls.__enter__, workflow_cls.__exit__
+    if getattr(enter, "_traced", False):
+        return
+
+    @functools.wraps(enter)
+    def traced_enter(self, *args, **kwargs):
+        name = getattr(self, "workflow_definition_name", None) or ""
+        self._trace_span = _tracer.span("workflow", **{"workflow.name": name})
+        self._trace_span.__enter__()
+        return enter(self, *args, **kwargs)
+
+    @functools.wraps(exit_)
+    def traced_exit(self, *exc_info):
+        try:
+            return exit_(self, *exc_info)
+        finally:
+            span_cm = self.__dict__.pop("_trace_span", None)
+            if span_cm is not None:
+                span_cm.__exit__(*exc_info)
+
+    traced_enter._traced = True
+    workflow_cls.__enter__, workflow_cls.__exit__ = traced_enter, traced_exit
+
+
+def instrument(trace_path: str | None = None, trace_endpoint: str | None = None) -> Tracer:
+    """
+    Installs the tracer and wraps NovaAct so every browser launch and act/act_get call is timed.
+
+    The NovaAct class is patched in place, so this works whether it is called before or after the
+    example imports NovaAct. Calling it again returns the tracer that is already installed.
+    """
+    global _tracer
+    with _install_lock:
+        if _tracer is not None:
+            return _tracer
+        _tracer = Tracer(trace_path, trace_endpoint)
+        _wrap_method(nova_act.NovaAct, "start", "nova_act.start", SPAN_KIND_INTERNAL, _describe_start)
+        _wrap_method(nova_act.NovaAct, "act", "nova_act.act", SPAN_KIND_CLIENT, _describe_act)
+        _wrap_method(nova_act.NovaAct, "act_get", "nova_act.act_get", SPAN_KIND_CLIENT, _describe_act)
+        workflow_cls = getattr(nova_act, "Workflow", None)
+        if workflow_cls is not None and hasattr(workflow_cls, "__enter__"):
+            _wrap_workflow(workflow_cls)
+        atexit.register(_tracer.shutdown)
+        return _tracer
+
+
+def instrument_from_env() -> Tracer | None:
+    """Enables tracing when NOVA_ACT_TRACE_PATH or NOVA_ACT_TRACE_ENDPOINT is set."""
+    trace_path = os.getenv("NOVA_ACT_TRACE_PATH")
+    trace_endpoint = os.getenv("NOVA_ACT_TRACE_ENDPOINT")
+    if not (trace_path or trace_endpoint):
+        return None
+    return instrument(trace_path, trace_endpoint)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--trace_path", default=os.getenv("NOVA_ACT_TRACE_PATH"), help="File to append OTLP/JSON spans to")
+    parser.add_argument("--trace_endpoint", default=os.getenv("NOVA_ACT_TRACE_ENDPOINT"), help="OTLP/HTTP collector base URL")
+    parser.add_argument("--handler", help="Run a cdk/* handler instead of an example, e.g. cdk/lambda/app.py:handler")
+    parser.add_argument("--event", default="{}", help="JSON event passed to --handler")
+    parser.add_argument("module", nargs="?", help="Example module to run, e.g. examples.qa")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the example")
+    options = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    tracer = instrument(options.trace_path, options.trace_endpoint)
+
+    if options.handler:
+        from examples.replay import load_handler
+
+        handler = load_handler(options.handler)
+        event = json.loads(options.event)
+        takes_context = len(inspect.signature(handler).parameters) > 1
+        with tracer.span("handler", **{"handler": options.handler}):
+            result = handler(event, None) if takes_context else handler(event)
+        print(json.dumps(result, default=str))
+    elif options.module:
+        sys.argv = [options.module, *options.args]
+        runpy.run_module(options.module, run_name="__main__", alter_sys=True)
+    else:
+        parser.error("either a module or --handler is required")
+
+
+if __name__ == "__main__":
+    main()
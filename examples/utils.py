@@ -2,27 +2,139 @@
 Utility functions for examples
 """
 
+import atexit
+import contextlib
+import contextvars
+import functools
+import json
 import logging
+import logging.handlers
+import math
 import os
-from typing import get_args
+import queue
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, get_args
 
+from nova_act import NovaAct, tool, workflow
 from nova_act.types.workflow import ModelId
+from pydantic import BaseModel, TypeAdapter
+
+from examples.tracing import instrument_from_env, traced
+
+
+# Standard LogRecord attributes, so anything else passed via `extra=` can be added to JSON output
+_LOG_RECORD_FIELDS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+def _truncate_log_value(value: Any, max_chars: int) -> Any:
+  if isinstance(value, str) and len(value) > max_chars:
+    return f"{value[:max_chars]}... [{len(value) - max_chars} more chars]"
+  return value
+
+
+class JsonLogFormatter(logging.Formatter):
+  """
+  Formats each record as one JSON object, truncating the message and extra fields to `max_chars`.
+  """
+
+  def __init__(self, max_chars: int):
+    super().__init__()
+    self.max_chars = max_chars
+
+  def format(self, record: logging.LogRecord) -> str:
+    entry = {
+      "timestamp": self.formatTime(record),
+      "level": record.levelname,
+      "logger": record.name,
+      "thread": record.threadName,
+      "message": _truncate_log_value(record.getMessage(), self.max_chars),
+    }
+    for key, value in vars(record).items():
+      if key not in _LOG_RECORD_FIELDS:
+        entry[key] = _truncate_log_value(value if isinstance(value, (int, float, bool)) else str(value), self.max_chars)
+    return json.dumps(entry, default=str)
+
+
+class TruncatingFormatter(logging.Formatter):
+  """
+  The examples' plain-text format, with long messages truncated to `max_chars`.
+  """
+
+  def __init__(self, max_chars: int):
+    super().__init__("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    self.max_chars = max_chars
+
+  def formatMessage(self, record: logging.LogRecord) -> str:
+    record.message = _truncate_log_value(record.message, self.max_chars)
+    return super().formatMessage(record)
+
+
+class DebugSampler(logging.Filter):
+  """
+  Keeps every record at INFO and above, but only a `rate` fraction of DEBUG records.
+  """
+
+  def __init__(self, rate: float):
+    super().__init__()
+    self.rate = rate
+
+  def filter(self, record: logging.LogRecord) -> bool:
+    return record.levelno > logging.DEBUG or random.random() < self.rate
+
+
+@functools.cache
+def configure_logging() -> logging.handlers.QueueListener:
+  """
+  Configures the root logger once per process from the environment.
+
+  Records are put on a queue and written to stderr by a background listener thread, so slow
+  console I/O never blocks a workflow. Set NOVA_ACT_LOG_FORMAT=json for structured output,
+  NOVA_ACT_LOG_LEVEL to change the level, NOVA_ACT_LOG_MAX_CHARS to bound message size and
+  NOVA_ACT_LOG_DEBUG_SAMPLE_RATE for the fraction of DEBUG records kept.
+  """
+  max_chars = int(os.getenv("NOVA_ACT_LOG_MAX_CHARS", "20000"))
+  stream_handler = logging.StreamHandler()
+  if os.getenv("NOVA_ACT_LOG_FORMAT", "text").lower() == "json":
+    stream_handler.setFormatter(JsonLogFormatter(max_chars))
+  else:
+    stream_handler.setFormatter(TruncatingFormatter(max_chars))
+
+  log_queue: queue.Queue = queue.Queue()
+  queue_handler = logging.handlers.QueueHandler(log_queue)
+  # Dropped DEBUG records are discarded before their message is ever formatted
+  queue_handler.addFilter(DebugSampler(float(os.getenv("NOVA_ACT_LOG_DEBUG_SAMPLE_RATE", "1.0"))))
+
+  root = logging.getLogger()
+  root.handlers = [queue_handler]
+  root.setLevel(os.getenv("NOVA_ACT_LOG_LEVEL", "INFO").upper())
+
+  listener = logging.handlers.QueueListener(log_queue, stream_handler)
+  listener.start()
+  # Stopping the listener writes out anything still queued
+  atexit.register(listener.stop)
+  return listener
 
 
 def get_logger(name: str):
   """
   Creates and configures a common logger for each example.
   """
-  logger = logging.getLogger(name)
-  logging.basicConfig(
-      level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-  )
-  return logger
+  configure_logging()
+  return logging.getLogger(name)
 
 def get_workflow_kwargs():
   """
   Returns the kwargs for the Nova Act @workflow decorator given the environment configuration.
+  Also enables span tracing when NOVA_ACT_TRACE_PATH or NOVA_ACT_TRACE_ENDPOINT is set.
   """
+  instrument_from_env()
   api_key = os.getenv("NOVA_ACT_API_KEY", None)
   workflow_definition_name = os.getenv("NOVA_ACT_WORKFLOW_DEFINITION_NAME", None)
 
@@ -32,3 +144,688 @@ def get_workflow_kwargs():
     "workflow_definition_name": workflow_definition_name
   }
 
+
+@functools.cache
+def get_schema(model: type[BaseModel]) -> dict:
+  """
+  Returns the JSON schema for `model` to pass to act_get(), generated once per model.
+  The returned dict is shared, so don't modify it.
+  """
+  return model.model_json_schema()
+
+
+def validate_response(model: type[BaseModel], response: Any) -> BaseModel:
+  """
+  Validates an act_get() response against `model`. Responses that are still raw JSON are parsed
+  and validated in a single pass by pydantic-core.
+  """
+  if isinstance(response, (str, bytes)):
+    return model.model_validate_json(response)
+  return model.model_validate(response)
+
+
+@functools.cache
+def _get_list_adapter(model: type[BaseModel]) -> TypeAdapter:
+  return TypeAdapter(list[model])
+
+
+def validate_responses(model: type[BaseModel], responses: list[Any]) -> list[BaseModel]:
+  """
+  Validates a batch of act_get() responses against `model` in one validator call, with a validator
+  built once per model. When every response is still raw JSON, they are joined into one JSON array
+  and parsed and validated in a single pass.
+  """
+  if all(isinstance(response, str) for response in responses):
+    validated = _get_list_adapter(model).validate_json(f"[{','.join(responses)}]")
+    # A response that is itself a comma-separated run of objects would add items to the array
+    if len(validated) != len(responses):
+      raise ValueError(f"Expected {len(responses)} responses, found {len(validated)} in the raw JSON")
+    return validated
+  return _get_list_adapter(model).validate_python(
+    [
+      model.model_validate_json(response) if isinstance(response, (str, bytes)) else response
+      for response in responses
+    ]
+  )
+
+
+class NovaActSessionPool:
+  """
+  Runs jobs on a fixed number of warm, reusable NovaAct sessions.
+
+  Playwright's sync API is bound to the thread that started it, so each session is owned by a
+  dedicated worker thread. Jobs are callables that receive the session as their first argument.
+  Before each job the session is health checked and reset to `starting_page` (or the page given to
+  `submit_at()`), and it is recycled after `max_uses` jobs or whenever a job raises.
+
+  When `max_pending` is set, `submit()` blocks once that many jobs are waiting, which applies
+  backpressure to a producer that finds work faster than the sessions can complete it.
+
+  With a `profile_pool`, each session runs on its own copy of a Chrome user data dir, which goes
+  back to the profile pool when the session stops.
+  """
+
+  def __init__(
+    self,
+    size: int,
+    starting_page: str,
+    max_uses: int = 20,
+    max_pending: int = 0,
+    profile_pool: "ChromeProfilePool | None" = None,
+    **nova_act_kwargs,
+  ):
+    if size < 1:
+      raise ValueError("size must be at least 1")
+    self.starting_page = starting_page
+    self.max_uses = max_uses
+    self._profile_pool = profile_pool
+    self._profiles: dict[int, str] = {}
+    self._nova_act_kwargs = nova_act_kwargs
+    self._jobs: queue.Queue = queue.Queue(maxsize=max_pending)
+    self._workers: list[threading.Thread] = []
+    self._lock = threading.Lock()
+    self._closed = False
+    self._retiring = 0
+    # id() of every session that started and has not been stopped yet
+    self._live_sessions: set[int] = set()
+    for _ in range(size):
+      self._spawn_worker()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.shutdown()
+
+  @property
+  def size(self) -> int:
+    with self._lock:
+      return len(self._workers) - self._retiring
+
+  @property
+  def live_sessions(self) -> int:
+    """
+    The number of sessions that currently have a browser running.
+    """
+    with self._lock:
+      return len(self._live_sessions)
+
+  def resize(self, size: int) -> None:
+    """
+    Grows or shrinks the pool. Surplus workers stop their session after their current job.
+    """
+    if size < 1:
+      raise ValueError("size must be at least 1")
+    with self._lock:
+      if self._closed:
+        return
+      current = len(self._workers) - self._retiring
+      if size < current:
+        self._retiring += current - size
+        return
+      growth = size - current
+      cancelled = min(growth, self._retiring)
+      self._retiring -= cancelled
+      for _ in range(growth - cancelled):
+        self._spawn_worker()
+
+  def submit(self, fn, *args, **kwargs) -> Future:
+    """
+    Schedules `fn(nova, *args, **kwargs)` on the next free session.
+    """
+    return self.submit_at(self.starting_page, fn, *args, **kwargs)
+
+  def submit_at(self, page: str, fn, *args, **kwargs) -> Future:
+    """
+    Like submit(), but the session is reset to `page` instead of the pool's starting page.
+    """
+    if self._closed:
+      raise RuntimeError("cannot submit to a pool that has been shut down")
+    future: Future = Future()
+    self._jobs.put((future, page, fn, args, kwargs))
+    return future
+
+  def shutdown(self, wait: bool = True) -> None:
+    """
+    Stops every session once the queued jobs have run.
+    """
+    with self._lock:
+      if self._closed:
+        return
+      self._closed = True
+      workers = list(self._workers)
+    for _ in workers:
+      self._jobs.put(None)
+    if wait:
+      for worker in workers:
+        worker.join()
+
+  def _spawn_worker(self) -> None:
+    # Each worker runs in its own copy of the caller's context so sessions see the active @workflow.
+    context = contextvars.copy_context()
+    worker = threading.Thread(target=context.run, args=(self._run_worker,), daemon=True)
+    self._workers.append(worker)
+    worker.start()
+
+  def _run_worker(self) -> None:
+    nova = None
+    uses = 0
+    try:
+      while not self._should_retire():
+        job = self._jobs.get()
+        if job is None:
+          break
+        future, page, fn, args, kwargs = job
+        if not future.set_running_or_notify_cancel():
+          continue
+        try:
+          # _checkout stops the session it is given when it fails, so drop our reference first
+          session, nova = nova, None
+          nova, uses = self._checkout(session, uses, page)
+          result = fn(nova, *args, **kwargs)
+        except BaseException as e:
+          future.set_exception(e)
+          nova = self._stop_session(nova)
+        else:
+          future.set_result(result)
+          uses += 1
+    finally:
+      self._stop_session(nova)
+      with self._lock:
+        self._workers.remove(threading.current_thread())
+
+  def _should_retire(self) -> bool:
+    with self._lock:
+      if self._retiring > 0:
+        self._retiring -= 1
+        return True
+      return False
+
+  def _checkout(self, nova, uses: int, page: str):
+    """
+    Returns a session on `page` ready for the next job, reusing `nova` when it is healthy. If this
+    raises, `nova` has already been stopped.
+    """
+    if nova is not None and (uses >= self.max_uses or not self._is_healthy(nova)):
+      nova = self._stop_session(nova)
+    if nova is None:
+      nova_act_kwargs = self._nova_act_kwargs
+      profile = None
+      if self._profile_pool is not None:
+        profile = self._profile_pool.acquire()
+        nova_act_kwargs = {**nova_act_kwargs, "user_data_dir": profile, "clone_user_data_dir": False}
+      try:
+        nova = NovaAct(starting_page=page, **nova_act_kwargs)
+        nova.start()
+      except BaseException:
+        if profile is not None:
+          self._profile_pool.release(profile)
+        raise
+      with self._lock:
+        self._live_sessions.add(id(nova))
+        if profile is not None:
+          self._profiles[id(nova)] = profile
+      return nova, 0
+    try:
+      nova.go_to_url(page)
+    except BaseException:
+      self._stop_session(nova)
+      raise
+    return nova, uses
+
+  @staticmethod
+  def _is_healthy(nova) -> bool:
+    try:
+      return not nova.page.is_closed()
+    except Exception:
+      return False
+
+  def _stop_session(self, nova) -> None:
+    if nova is not None:
+      with self._lock:
+        # Only sessions that started count, and each is only counted out once
+        self._live_sessions.discard(id(nova))
+      try:
+        nova.stop()
+      except Exception:
+        logging.getLogger(__name__).warning("Failed to stop NovaAct session", exc_info=True)
+      with self._lock:
+        profile = self._profiles.pop(id(nova), None)
+      if profile is not None:
+        self._profile_pool.release(profile)
+    return None
+
+
+# The session shared by the tool calls of the current agent run, see agent_session()
+_AGENT_SESSION: contextvars.ContextVar["NovaActSessionPool | None"] = contextvars.ContextVar(
+  "agent_session", default=None
+)
+
+
+@contextlib.contextmanager
+def agent_session(starting_page: str, **nova_act_kwargs):
+  """
+  Shares one NovaAct session between every tool call made during an agent run, and stops it when
+  the block exits. The browser is only launched by the first tool call that uses it.
+
+    with agent_session("https://example.com"):
+      response = agent(prompt)
+
+  Tools run their browser work with run_in_agent_session(). Tool calls are run one at a time on
+  the shared session, so they never see each other's page.
+  """
+  pool = NovaActSessionPool(size=1, starting_page=starting_page, **nova_act_kwargs)
+  token = _AGENT_SESSION.set(pool)
+  try:
+    yield pool
+  finally:
+    _AGENT_SESSION.reset(token)
+    pool.shutdown()
+
+
+def run_in_agent_session(fn, starting_page: str, *args, **kwargs):
+  """
+  Returns `fn(nova, *args, **kwargs)`, run on the agent run's shared session at `starting_page`.
+  Outside agent_session(), `fn` gets its own NovaAct in its own workflow, so a tool can still be
+  called on its own.
+  """
+  pool = _AGENT_SESSION.get()
+  if pool is not None:
+    return pool.submit_at(starting_page, fn, *args, **kwargs).result()
+
+  @workflow(**get_workflow_kwargs())
+  def run_standalone():
+    with NovaAct(starting_page=starting_page) as nova:
+      return fn(nova, *args, **kwargs)
+
+  return run_standalone()
+
+
+# Chrome holds these in the live profile to detect a running instance. A copy must not have them.
+CHROME_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie")
+
+
+def clone_profile(source_dir: str, dest_dir: str, reflink: bool = True) -> bool:
+  """
+  Copies a Chrome user data dir to `dest_dir`, without Chrome's lock files.
+
+  With `reflink`, the copy is a copy-on-write clone (`cp --reflink` on Btrfs/XFS, `cp -c` on APFS).
+  A clone takes about as long as listing the files, and uses no extra disk until Chrome writes to
+  it. Falls back to a regular copy where the filesystem can't clone. Returns whether it cloned.
+  Hardlinks are never used, because Chrome rewrites its SQLite databases in place, which would
+  corrupt the source profile.
+  """
+  cloned = False
+  if reflink:
+    command = ["cp", "-c", "-R"] if sys.platform == "darwin" else ["cp", "-R", "--reflink=always"]
+    try:
+      cloned = subprocess.run(
+        [*command, source_dir, dest_dir], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+      ).returncode == 0
+    except OSError:
+      cloned = False
+    if not cloned:
+      shutil.rmtree(dest_dir, ignore_errors=True)
+  if not cloned:
+    shutil.copytree(
+      source_dir, dest_dir, symlinks=True, ignore=shutil.ignore_patterns(*CHROME_LOCK_FILES)
+    )
+  for name in CHROME_LOCK_FILES:
+    lock_path = os.path.join(dest_dir, name)
+    if os.path.lexists(lock_path):
+      os.remove(lock_path)
+  return cloned
+
+
+class ChromeProfilePool:
+  """
+  Keeps `size` ready-to-use copies of a Chrome user data dir, so parallel sessions can each start
+  with a logged-in profile without waiting for a copy.
+
+  Copies are copy-on-write clones where the filesystem supports them (see `clone_profile`). A
+  returned copy has been changed by its session, so it is replaced with a fresh copy of
+  `source_dir` in the background before it is handed out again. Pass each copy to NovaAct with
+  `clone_user_data_dir=False`, or give the pool to NovaActSessionPool as `profile_pool`.
+
+  A copy that fails `max_refresh_failures` times in a row, for example because `source_dir` was
+  deleted, is given up on, and acquire() raises instead of waiting for it.
+  """
+
+  def __init__(
+    self, source_dir: str, size: int, clone_dir: str | None = None, max_refresh_failures: int = 3
+  ):
+    if size < 1:
+      raise ValueError("size must be at least 1")
+    if not os.path.isdir(source_dir):
+      raise ValueError(f"{source_dir} is not a directory")
+    self.source_dir = os.path.abspath(source_dir)
+    self._owns_clone_dir = clone_dir is None
+    self.clone_dir = clone_dir or tempfile.mkdtemp(prefix="nova-act-profiles-")
+    os.makedirs(self.clone_dir, exist_ok=True)
+    self._reflink = True
+    self.max_refresh_failures = max_refresh_failures
+    # Ready copies, or the error that made the refresher give up on one
+    self._ready: queue.Queue = queue.Queue()
+    self._refresh: queue.Queue = queue.Queue()
+    self._closed = False
+    self._refresher = threading.Thread(target=self._run_refresher, daemon=True)
+    self._refresher.start()
+    for i in range(size):
+      self._refresh.put(os.path.join(self.clone_dir, f"profile-{i}"))
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+  def acquire(self, timeout: float | None = 300) -> str:
+    """
+    Returns the path of a ready copy, waiting up to `timeout` seconds for one to be refreshed.
+    """
+    if self._closed:
+      raise RuntimeError("cannot acquire from a pool that has been closed")
+    try:
+      path = self._ready.get(timeout=timeout)
+    except queue.Empty:
+      raise TimeoutError(f"no Chrome profile became ready within {timeout}s") from None
+    if isinstance(path, BaseException):
+      # Put the error back so every other waiting caller sees it too
+      self._ready.put(path)
+      raise RuntimeError(f"Chrome profiles could not be copied from {self.source_dir}") from path
+    return path
+
+  def release(self, path: str) -> None:
+    """
+    Returns a copy to the pool. It is replaced with a fresh copy before it is handed out again.
+    """
+    if not self._closed:
+      self._refresh.put(path)
+
+  @contextlib.contextmanager
+  def lease(self, timeout: float | None = 300):
+    path = self.acquire(timeout)
+    try:
+      yield path
+    finally:
+      self.release(path)
+
+  def close(self) -> None:
+    """
+    Stops refreshing copies and, if the pool created its clone directory, deletes it.
+    """
+    if self._closed:
+      return
+    self._closed = True
+    self._refresh.put(None)
+    self._refresher.join()
+    if self._owns_clone_dir:
+      shutil.rmtree(self.clone_dir, ignore_errors=True)
+
+  def _run_refresher(self) -> None:
+    logger = logging.getLogger(__name__)
+    failures: dict[str, int] = {}
+    while True:
+      path = self._refresh.get()
+      if path is None or self._closed:
+        return
+      started = time.monotonic()
+      try:
+        shutil.rmtree(path, ignore_errors=True)
+        cloned = clone_profile(self.source_dir, path, reflink=self._reflink)
+      except Exception as e:
+        failures[path] = failures.get(path, 0) + 1
+        if failures[path] >= self.max_refresh_failures:
+          logger.error(f"Giving up on Chrome profile {path} after {failures[path]} failed copies: {e}")
+          self._ready.put(e)
+          continue
+        logger.warning(f"Failed to copy Chrome profile to {path}", exc_info=True)
+        time.sleep(1)
+        self._refresh.put(path)
+        continue
+      failures.pop(path, None)
+      if self._reflink and not cloned:
+        # Stop trying once the filesystem has shown it can't clone
+        self._reflink = False
+        logger.info("Filesystem does not support copy-on-write clones, copying Chrome profiles instead")
+      logger.debug(f"Chrome profile {path} ready in {time.monotonic() - started:.2f}s")
+      self._ready.put(path)
+
+
+def get_memory_mb() -> tuple[float, float] | None:
+  """
+  Returns (total, available) memory in MiB for this process, honouring cgroup v1/v2 limits.
+  Returns None where /proc is not available.
+  """
+  try:
+    with open("/proc/meminfo") as f:
+      meminfo = {line.split(":")[0]: int(line.split()[1]) for line in f}
+  except (OSError, ValueError, IndexError):
+    return None
+  total = meminfo["MemTotal"] / 1024
+  available = meminfo.get("MemAvailable", meminfo.get("MemFree", 0)) / 1024
+
+  for limit_path, usage_path in (
+    ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory.current"),
+    ("/sys/fs/cgroup/memory/memory.limit_in_bytes", "/sys/fs/cgroup/memory/memory.usage_in_bytes"),
+  ):
+    try:
+      with open(limit_path) as f:
+        limit = f.read().strip()
+      with open(usage_path) as f:
+        usage = int(f.read().strip())
+    except (OSError, ValueError):
+      continue
+    if limit.isdigit() and int(limit) / 2**20 < total:
+      total = int(limit) / 2**20
+      available = min(available, total - usage / 2**20)
+    break
+
+  return total, max(available, 0.0)
+
+
+def get_child_rss_mb() -> float | None:
+  """
+  Returns the combined resident set size in MiB of every process descended from this one, which
+  is where the browsers launched by NovaAct live. Returns None where /proc is not available.
+  """
+  try:
+    pids = [int(entry) for entry in os.listdir("/proc") if entry.isdigit()]
+  except OSError:
+    return None
+
+  children: dict[int, list[int]] = {}
+  for pid in pids:
+    try:
+      with open(f"/proc/{pid}/stat") as f:
+        # The command name may contain spaces, so split after its closing parenthesis.
+        ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+    except (OSError, ValueError, IndexError):
+      continue
+    children.setdefault(ppid, []).append(pid)
+
+  page_size = os.sysconf("SC_PAGE_SIZE")
+  rss = 0
+  pending = list(children.get(os.getpid(), []))
+  while pending:
+    pid = pending.pop()
+    pending.extend(children.get(pid, []))
+    try:
+      with open(f"/proc/{pid}/statm") as f:
+        rss += int(f.read().split()[1]) * page_size
+    except (OSError, ValueError, IndexError):
+      continue
+  return rss / 2**20
+
+
+class ConcurrencyController:
+  """
+  Decides how many browser sessions may run at once.
+
+  The starting concurrency comes from the memory available to the process (including cgroup
+  limits) divided by an estimate of one session's footprint. As the run progresses the estimate
+  is replaced with the measured RSS of the running browsers, and the pool is grown or shrunk so
+  that `headroom` of the memory limit stays free.
+  """
+
+  def __init__(
+    self,
+    max_workers: int | None = None,
+    min_workers: int = 1,
+    session_rss_mb: float = 700,
+    headroom: float = 0.2,
+  ):
+    self.max_workers = max_workers or 2 * (os.cpu_count() or 1)
+    self.min_workers = min(min_workers, self.max_workers)
+    self.session_rss_mb = session_rss_mb
+    self.headroom = headroom
+    self.completed = 0
+    self.concurrency_history: list[int] = []
+    self._started_at = time.monotonic()
+    self._logger = logging.getLogger(__name__)
+
+  def initial_workers(self) -> int:
+    """
+    Returns the concurrency to start with, before any session has been measured.
+    """
+    workers = self._target(live_sessions=0, current=0)
+    self.concurrency_history.append(workers)
+    self._logger.info(f"Starting with concurrency {workers} (max {self.max_workers})")
+    return workers
+
+  def adjust(self, pool: NovaActSessionPool) -> int:
+    """
+    Records a completed job, re-measures memory and resizes `pool` if the target changed.
+    """
+    self.completed += 1
+    live_sessions = pool.live_sessions
+    rss = get_child_rss_mb()
+    if live_sessions and rss:
+      # Smooth the estimate so a single page with a heavy map doesn't swing the pool size.
+      self.session_rss_mb = 0.5 * self.session_rss_mb + 0.5 * rss / live_sessions
+
+    current = pool.size
+    workers = self._target(live_sessions, current)
+    if workers != current:
+      self._logger.info(
+        f"Resizing pool from {current} to {workers} sessions (~{self.session_rss_mb:.0f} MiB each)"
+      )
+      pool.resize(workers)
+      self.concurrency_history.append(workers)
+    return workers
+
+  def report(self) -> None:
+    """
+    Logs the concurrency that was used and the throughput achieved.
+    """
+    elapsed = time.monotonic() - self._started_at
+    throughput = self.completed / elapsed * 60 if elapsed else 0.0
+    self._logger.info(
+      f"Completed {self.completed} jobs in {elapsed:.1f}s ({throughput:.1f}/min); "
+      f"concurrency {' -> '.join(map(str, self.concurrency_history))}, "
+      f"~{self.session_rss_mb:.0f} MiB per session"
+    )
+
+  def _target(self, live_sessions: int, current: int) -> int:
+    memory = get_memory_mb()
+    if memory is None:
+      return max(current, min(self.max_workers, os.cpu_count() or 1))
+    total, available = memory
+    spare = available - self.headroom * total
+    # Sessions that are configured but not yet launched will still need their share.
+    spare -= max(current - live_sessions, 0) * self.session_rss_mb
+    workers = current + math.floor(spare / self.session_rss_mb)
+    return max(self.min_workers, min(self.max_workers, workers))
+
+
+# Sets every mapped field in one evaluate() call. Values are assigned through the native setter and
+# followed by input/change events so that framework-controlled inputs (React, Vue) pick them up.
+_FILL_FIELDS_JS = """
+(fields) => {
+  const result = {filled: [], not_found: []};
+  for (const [name, selector, value] of fields) {
+    const element = document.querySelector(selector);
+    if (!element) {
+      result.not_found.push(name);
+      continue;
+    }
+    if (element.type === "radio") {
+      if (!element.checked) element.click();
+    } else if (element.type === "checkbox") {
+      const checked = ["true", "yes", "on", "1"].includes(String(value).toLowerCase());
+      if (element.checked !== checked) element.click();
+    } else {
+      let text = String(value);
+      if (element instanceof HTMLSelectElement) {
+        const option = [...element.options].find(
+          (o) => o.value === text || o.text.trim().toLowerCase() === text.toLowerCase()
+        );
+        if (!option) {
+          result.not_found.push(name);
+          continue;
+        }
+        text = option.value;
+      }
+      const prototype = Object.getPrototypeOf(element);
+      Object.getOwnPropertyDescriptor(prototype, "value").set.call(element, text);
+      element.dispatchEvent(new Event("input", {bubbles: true}));
+      element.dispatchEvent(new Event("change", {bubbles: true}));
+    }
+    result.filled.push(name);
+  }
+  return result;
+}
+"""
+
+
+def _escape_css_string(value: str) -> str:
+  return value.replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
+
+
+class FormFieldFiller:
+  """
+  Fills form fields with known selectors directly in the page, so the model only has to handle
+  navigation and any fields that are not mapped.
+
+  `field_map` maps field names to CSS selectors. A `{value}` placeholder in a selector is replaced
+  with the field's value, which is how a radio button or option is chosen. Expose `tool` to
+  NovaAct and call `bind(nova)` once the session has started. Bindings are per thread, because a
+  Playwright page can only be used from the thread that created it.
+  """
+
+  def __init__(self, field_map: dict[str, str], tool_name: str = "fill_known_fields"):
+    self.field_map = field_map
+    self._sessions = threading.local()
+
+    def fill_known_fields(field_values: dict[str, str]) -> dict:
+      return self.fill(field_values)
+
+    fill_known_fields.__name__ = tool_name
+    fill_known_fields.__doc__ = f"""
+      Fills known form fields on the current page in one step. Call this before typing into any field.
+
+      Args:
+          field_values: Maps field names to the values to enter. Known field names: {", ".join(field_map)}.
+
+      Returns:
+          dict: `filled` lists fields that were set. Fields in `not_found` are not on the current
+          page and fields in `unmapped` are unknown; enter those yourself.
+      """
+    self.tool = tool(traced(fill_known_fields))
+
+  def bind(self, nova: NovaAct) -> None:
+    self._sessions.nova = nova
+
+  def fill(self, field_values: dict[str, str]) -> dict:
+    nova = getattr(self._sessions, "nova", None)
+    if nova is None:
+      raise RuntimeError("FormFieldFiller.bind() must be called with the active NovaAct session")
+
+    fields = [
+      [name, self.field_map[name].replace("{value}", _escape_css_string(str(value))), value]
+      for name, value in field_values.items()
+      if name in self.field_map
+    ]
+    result = nova.page.evaluate(_FILL_FIELDS_JS, fields)
+    result["unmapped"] = [name for name in field_values if name not in self.field_map]
+    return result
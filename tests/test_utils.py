@@ -0,0 +1,37 @@
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from examples.utils import validate_responses
+
+
+class Flight(BaseModel):
+    number: str
+    seats: int
+
+
+def test_validate_responses_parses_raw_json_in_one_batch():
+    flights = validate_responses(
+        Flight, ['{"number": "NA1", "seats": 3}', '{"number": "NA2", "seats": 0}']
+    )
+    assert flights == [Flight(number="NA1", seats=3), Flight(number="NA2", seats=0)]
+
+
+def test_validate_responses_accepts_parsed_and_mixed_responses():
+    flights = validate_responses(
+        Flight, [{"number": "NA1", "seats": 3}, '{"number": "NA2", "seats": 0}', Flight(number="NA3", seats=1)]
+    )
+    assert [flight.number for flight in flights] == ["NA1", "NA2", "NA3"]
+
+
+def test_validate_responses_empty_batch():
+    assert validate_responses(Flight, []) == []
+
+
+def test_validate_responses_rejects_invalid_response():
+    with pytest.raises(ValidationError):
+        validate_responses(Flight, ['{"number": "NA1", "seats": "many"}'])
+
+
+def test_validate_responses_rejects_response_that_splits_into_several():
+    with pytest.raises(ValueError):
+        validate_responses(Flight, ['{"number": "NA1", "seats": 3}, {"number": "NA2", "seats": 0}'])